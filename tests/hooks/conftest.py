@@ -0,0 +1,74 @@
+"""
+Hook test configuration
+
+The hook modules import HookContext/HookResult, HookRunner and log_anomaly
+from tools.hooks.lib. Where those modules are not available, minimal local
+stand-ins are registered so the hooks themselves can be imported and run.
+"""
+
+import os
+import sys
+import types
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class HookResult:
+    success: bool
+    message: str = ""
+    priority: str = "P2"
+    should_halt: bool = False
+    details: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class HookContext:
+    run_id: str
+    run_path: str
+    phase: str = ""
+    universe: Optional[str] = None
+    date_start: Optional[str] = None
+    date_end: Optional[str] = None
+    config_hash: Optional[str] = None
+    hook_name: str = ""
+    timestamp: Optional[datetime] = field(default_factory=datetime.now)
+    trades_path: Optional[str] = None
+    series_path: Optional[str] = None
+    metrics_path: Optional[str] = None
+    manifest_path: Optional[str] = None
+    events_path: Optional[str] = None
+    
+    @property
+    def hook_log_path(self) -> str:
+        return os.path.join(self.run_path, "hooks", f"{self.hook_name}.json")
+    
+    def ensure_hook_dir(self) -> None:
+        os.makedirs(os.path.join(self.run_path, "hooks"), exist_ok=True)
+
+
+# Anomalies reported through the stand-in log_anomaly, for assertions
+logged_anomalies: List[Dict[str, Any]] = []
+
+
+def log_anomaly(**kwargs) -> None:
+    logged_anomalies.append(kwargs)
+
+
+class HookRunner:
+    pass
+
+
+def _install(name: str, **attrs) -> None:
+    try:
+        __import__(name)
+    except ImportError:
+        module = types.ModuleType(name)
+        module.__dict__.update(attrs)
+        sys.modules[name] = module
+
+
+_install("tools.hooks.lib.hook_context", HookContext=HookContext, HookResult=HookResult)
+_install("tools.hooks.lib.hook_runner", HookRunner=HookRunner)
+_install("tools.hooks.lib.anomaly_logger", log_anomaly=log_anomaly)
@@ -0,0 +1,164 @@
+"""
+Tests for the before_registry_append duplicate-run guard
+
+Each test runs in its own working directory, since the hook resolves
+docs/runs/run_registry.csv and docs/runs/run_ids.idx relative to it.
+"""
+
+import csv
+import io
+import os
+
+import pytest
+
+from tools.hooks.lib.hook_context import HookContext
+from tools.hooks.core import before_registry_append as hook
+
+
+HEADER = list(hook._REGISTRY_HEADERS)
+
+
+@pytest.fixture
+def runs_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "docs" / "runs"
+    path.mkdir(parents=True)
+    return path
+
+
+@pytest.fixture
+def run_hook():
+    """Run the hook for a run_id, releasing the registry lock afterwards"""
+    contexts = []
+    
+    def run(run_id):
+        ctx = HookContext(
+            run_id=run_id,
+            run_path=f"./run_{len(contexts)}",
+            phase="registry",
+            hook_name="before_registry_append"
+        )
+        contexts.append(ctx)
+        result = hook.execute(ctx)
+        hook._release_registry_lock(ctx)
+        return result
+    
+    return run
+
+
+def _row(run_id, notes=""):
+    row = dict.fromkeys(HEADER, "")
+    row.update(run_id=run_id, config_hash="abc123", status="completed", notes=notes)
+    return [row[h] for h in HEADER]
+
+
+def _write_registry(runs_dir, rows, header=HEADER):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    writer.writerows(rows)
+    (runs_dir / "run_registry.csv").write_bytes(buffer.getvalue().encode())
+
+
+def _index(runs_dir):
+    return (runs_dir / "run_ids.idx").read_bytes().split()
+
+
+def _make_index_stale(runs_dir):
+    """Give the registry a later mtime than run_ids.idx, as after a manual edit"""
+    index_mtime = os.stat(runs_dir / "run_ids.idx").st_mtime_ns
+    os.utime(runs_dir / "run_registry.csv", ns=(index_mtime + 10**9, index_mtime + 10**9))
+
+
+def test_missing_registry_is_created_with_header(runs_dir, run_hook):
+    result = run_hook("run_001")
+    
+    assert result.success
+    assert (runs_dir / "run_registry.csv").read_bytes() == hook._EXPECTED_HEADER_LINE
+    assert _index(runs_dir) == []
+
+
+def test_header_only_registry_truncates_leftover_index(runs_dir, run_hook):
+    _write_registry(runs_dir, [])
+    (runs_dir / "run_ids.idx").write_bytes(b"run_001\n")
+    
+    result = run_hook("run_001")
+    
+    assert result.success
+    assert _index(runs_dir) == []
+
+
+def test_duplicate_run_id_halts(runs_dir, run_hook):
+    _write_registry(runs_dir, [_row("run_001"), _row("run_002")])
+    
+    result = run_hook("run_002")
+    
+    assert not result.success
+    assert result.should_halt
+    assert "Duplicate run_id" in result.message
+    assert sorted(_index(runs_dir)) == [b"run_001", b"run_002"]
+
+
+def test_new_run_id_passes(runs_dir, run_hook):
+    _write_registry(runs_dir, [_row("run_001"), _row("run_002")])
+    
+    result = run_hook("run_003")
+    
+    assert result.success
+
+
+def test_fresh_index_is_used_without_reading_rows(runs_dir, run_hook):
+    _write_registry(runs_dir, [_row("run_001")])
+    (runs_dir / "run_ids.idx").write_bytes(b"run_001\nrun_009\n")
+    
+    result = run_hook("run_009")
+    
+    assert not result.success
+    assert "Duplicate run_id" in result.message
+
+
+def test_stale_index_is_rebuilt(runs_dir, run_hook):
+    _write_registry(runs_dir, [_row("run_001")])
+    assert run_hook("run_002").success
+    
+    # Row added by hand after the index was written
+    _write_registry(runs_dir, [_row("run_001"), _row("run_002")])
+    _make_index_stale(runs_dir)
+    
+    result = run_hook("run_002")
+    
+    assert not result.success
+    assert sorted(_index(runs_dir)) == [b"run_001", b"run_002"]
+
+
+def test_manually_edited_header_with_essential_columns(runs_dir, run_hook):
+    header = ["status", "run_id", "config_hash"]
+    _write_registry(runs_dir, [["completed", "x", "abc123"]], header=header)
+    
+    result = run_hook("run_001")
+    
+    assert result.success
+    assert "Registry: valid headers (3 columns)" in result.details["checks"]
+
+
+def test_header_missing_essential_columns_halts(runs_dir, run_hook):
+    _write_registry(runs_dir, [["run_001", "completed"]], header=["run_id", "status"])
+    
+    result = run_hook("run_002")
+    
+    assert not result.success
+    assert "missing essential headers" in result.message
+    assert "config_hash" in result.message
+
+
+def test_multi_line_notes_are_not_read_as_run_ids(runs_dir, run_hook):
+    _write_registry(runs_dir, [
+        _row("run_001", notes="rerun after fix\nrun_002 was the broken one"),
+        _row("run_003"),
+    ])
+    
+    result = run_hook("run_002 was the broken one")
+    
+    assert result.success
+    assert sorted(_index(runs_dir)) == [b"run_001", b"run_003"]
+    assert not run_hook("run_003").success
@@ -0,0 +1,63 @@
+"""Tests for the on_accounting_mismatch safety hook"""
+
+import json
+
+import numpy as np
+import pytest
+
+from tools.hooks.lib.hook_context import HookContext
+from tools.hooks.safety import on_accounting_mismatch as hook
+
+
+@pytest.fixture
+def ctx(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # The registry descriptor is opened on first use, relative to the cwd
+    monkeypatch.setattr(hook, "_violations_fd", None)
+    return HookContext(
+        run_id="test_accounting",
+        run_path=str(tmp_path / "run"),
+        phase="analyzer",
+        hook_name="on_accounting_mismatch"
+    )
+
+
+def test_numpy_mismatch_values_are_reported(ctx, tmp_path, capsys):
+    mismatch = {
+        "expected_equity": np.float64(100000.0),
+        "actual_equity": np.float64(99995.5),
+        "difference": np.float64(-4.5),
+        "bar_index": np.int64(1234),
+        "equity_window": np.array([100000.0, 99995.5])
+    }
+    
+    result = hook.execute(ctx, mismatch)
+    
+    assert not result.success
+    assert result.should_halt
+    assert "hook failed" not in result.message
+    assert result.details["severity"] == "HIGH"
+    
+    report = json.loads((tmp_path / "run" / "ACCOUNTING_VIOLATION.json").read_bytes())
+    assert report["mismatch_data"] == {
+        "expected_equity": 100000.0,
+        "actual_equity": 99995.5,
+        "difference": -4.5,
+        "bar_index": 1234,
+        "equity_window": [100000.0, 99995.5]
+    }
+    
+    registry_lines = (tmp_path / "docs" / "runs" / "accounting_violations.jsonl").read_bytes().splitlines()
+    assert len(registry_lines) == 1
+    assert json.loads(registry_lines[0])["run_id"] == "test_accounting"
+    
+    assert "ACCOUNTING MISMATCH DETECTED" in capsys.readouterr().out
+
+
+def test_unserializable_mismatch_leaves_no_truncated_report(ctx, tmp_path):
+    result = hook.execute(ctx, {"difference": object()})
+    
+    assert not result.success
+    assert result.should_halt
+    assert "hook failed" in result.message
+    assert not (tmp_path / "run" / "ACCOUNTING_VIOLATION.json").exists()
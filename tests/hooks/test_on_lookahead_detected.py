@@ -0,0 +1,70 @@
+"""Tests for the on_lookahead_detected safety hook"""
+
+import json
+
+import numpy as np
+import pytest
+
+from tools.hooks.lib.hook_context import HookContext
+from tools.hooks.safety import on_lookahead_detected as hook
+
+
+@pytest.fixture
+def ctx(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # Append descriptors are opened on first use, relative to the cwd
+    monkeypatch.setattr(hook, "_append_fds", {})
+    (tmp_path / "run").mkdir()
+    return HookContext(
+        run_id="test_lookahead",
+        run_path=str(tmp_path / "run"),
+        phase="analyzer",
+        hook_name="on_lookahead_detected"
+    )
+
+
+def test_numpy_evidence_is_recorded_everywhere(ctx, tmp_path):
+    evidence = {
+        "violation_type": "future_price_access",
+        "location": "feature_engine.py:line_245",
+        "description": "Price data from t+1 used at time t",
+        "leaked_price": np.float64(42123.5),
+        "bar_index": np.int64(245)
+    }
+    
+    result = hook.execute(ctx, evidence)
+    
+    assert not result.success
+    assert result.should_halt
+    assert "hook failed" not in result.message
+    assert result.details["impact"]["impact_level"].startswith("SEVERE")
+    
+    report = json.loads((tmp_path / "run" / "LOOKAHEAD_VIOLATION.json").read_bytes())
+    assert report["evidence"]["leaked_price"] == 42123.5
+    assert report["evidence"]["bar_index"] == 245
+    
+    runs_dir = tmp_path / "docs" / "runs"
+    for log_name in ("lookahead_violations.jsonl", "critical_alerts.jsonl"):
+        lines = (runs_dir / log_name).read_bytes().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["run_id"] == "test_lookahead"
+    
+    status = json.loads((tmp_path / "run" / "run_status.json").read_bytes())
+    assert status["status"] == "INVALID_LOOKAHEAD"
+    assert not (tmp_path / "run" / "EMERGENCY_LOOKAHEAD_ALERT.json").exists()
+
+
+def test_emergency_record_survives_unserializable_evidence(ctx, tmp_path):
+    evidence = {"violation_type": "signal_timing", "detector": object()}
+    
+    result = hook.execute(ctx, evidence)
+    
+    assert not result.success
+    assert result.should_halt
+    assert "hook failed" in result.message
+    assert not (tmp_path / "run" / "LOOKAHEAD_VIOLATION.json").exists()
+    
+    emergency = json.loads((tmp_path / "run" / "EMERGENCY_LOOKAHEAD_ALERT.json").read_bytes())
+    assert emergency["emergency"] == "LOOKAHEAD_DETECTION_HOOK_FAILED"
+    assert emergency["original_evidence"]["violation_type"] == "signal_timing"
+    assert emergency["original_evidence"]["detector"].startswith("<object object")
@@ -11,10 +11,16 @@ from pathlib import Path
 from typing import Dict, Any
 from ..lib.hook_context import HookContext, HookResult
 
+# Registry paths are fixed relative to the project root
+_RUNS_DIR = Path("docs") / "runs"
+_DECISION_REGISTRY = _RUNS_DIR / "decision_registry.csv"
+_HALT_REGISTRY = _RUNS_DIR / "halt_registry.jsonl"
+_RERUN_QUEUE = Path("cloud") / "state" / "rerun_queue.jsonl"
+
 
 def _append_to_decision_registry(ctx: HookContext, decision: str, decision_data: dict = None) -> None:
     """Append evaluator decision to the decision registry CSV"""
-    decision_registry_path = os.path.join("docs", "runs", "decision_registry.csv")
+    decision_registry_path = _DECISION_REGISTRY
     
     # Extract data from decision_data if provided
     mtc_method = decision_data.get('mtc_method', 'none') if decision_data else 'none'
@@ -40,7 +46,7 @@ def _append_to_decision_registry(ctx: HookContext, decision: str, decision_data:
     ]
     
     # Append to CSV (create directory if needed)
-    os.makedirs(os.path.dirname(decision_registry_path), exist_ok=True)
+    decision_registry_path.parent.mkdir(parents=True, exist_ok=True)
     
     # Check if file exists to determine if we need headers
     file_exists = os.path.exists(decision_registry_path)
@@ -66,6 +72,8 @@ def execute(ctx: HookContext) -> HookResult:
     
     ctx.ensure_hook_dir() 
     actions = []
+    decision_data = None
+    reasoning = None
     
     try:
         # Look for evaluator decision file
@@ -115,23 +123,23 @@ def execute(ctx: HookContext) -> HookResult:
             halt_log = {
                 "run_id": ctx.run_id,
                 "timestamp": ctx.timestamp.isoformat() if ctx.timestamp else None,
-                "reason": reasoning if 'reasoning' in locals() else "Evaluator halt decision",
+                "reason": reasoning if reasoning is not None else "Evaluator halt decision",
                 "phase": ctx.phase,
                 "config_hash": ctx.config_hash
             }
             
-            halt_registry = os.path.join("docs", "runs", "halt_registry.jsonl")
-            os.makedirs(os.path.dirname(halt_registry), exist_ok=True)
+            halt_registry = _HALT_REGISTRY
+            halt_registry.parent.mkdir(parents=True, exist_ok=True)
             
             with open(halt_registry, 'a') as f:
                 f.write(json.dumps(halt_log) + '\n')
             
             # Log to decision registry
-            _append_to_decision_registry(ctx, decision, decision_data if 'decision_data' in locals() else None)
+            _append_to_decision_registry(ctx, decision, decision_data)
             
             return HookResult(
                 success=False,
-                message=f"Evaluator HALT decision: {reasoning[:100] if 'reasoning' in locals() else 'Critical issues detected'}",
+                message=f"Evaluator HALT decision: {reasoning[:100] if reasoning is not None else 'Critical issues detected'}",
                 priority="P0",  # Escalate to P0 for halt decisions
                 should_halt=True,
                 details={"decision": decision, "actions": actions}
@@ -145,7 +153,7 @@ def execute(ctx: HookContext) -> HookResult:
             rerun_request = {
                 "original_run_id": ctx.run_id,
                 "requested_at": ctx.timestamp.isoformat() if ctx.timestamp else None,
-                "reason": reasoning if 'reasoning' in locals() else "Evaluator rerun recommendation",
+                "reason": reasoning if reasoning is not None else "Evaluator rerun recommendation",
                 "config_hash": ctx.config_hash,
                 "universe": ctx.universe,
                 "date_range": f"{ctx.date_start} to {ctx.date_end}",
@@ -153,8 +161,8 @@ def execute(ctx: HookContext) -> HookResult:
                 "status": "pending"
             }
             
-            rerun_queue = os.path.join("cloud", "state", "rerun_queue.jsonl")
-            os.makedirs(os.path.dirname(rerun_queue), exist_ok=True)
+            rerun_queue = _RERUN_QUEUE
+            rerun_queue.parent.mkdir(parents=True, exist_ok=True)
             
             with open(rerun_queue, 'a') as f:
                 f.write(json.dumps(rerun_request) + '\n')
@@ -162,7 +170,7 @@ def execute(ctx: HookContext) -> HookResult:
             actions.append(f"Added rerun request to queue: {rerun_queue}")
             
             # Log to decision registry
-            _append_to_decision_registry(ctx, decision, decision_data if 'decision_data' in locals() else None)
+            _append_to_decision_registry(ctx, decision, decision_data)
             
             return HookResult(
                 success=True,  # Don't block current run
@@ -189,7 +197,7 @@ def execute(ctx: HookContext) -> HookResult:
                 json.dump(status_update, f, indent=2)
             
             # Log to decision registry
-            _append_to_decision_registry(ctx, decision, decision_data if 'decision_data' in locals() else None)
+            _append_to_decision_registry(ctx, decision, decision_data)
             
             return HookResult(
                 success=True,
@@ -203,7 +211,7 @@ def execute(ctx: HookContext) -> HookResult:
             actions.append(f"UNKNOWN decision: {decision}")
             
             # Log to decision registry (even unknown decisions should be tracked)
-            _append_to_decision_registry(ctx, decision, decision_data if 'decision_data' in locals() else None)
+            _append_to_decision_registry(ctx, decision, decision_data)
             
             return HookResult(
                 success=False,
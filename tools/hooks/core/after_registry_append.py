@@ -9,8 +9,18 @@ import json
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from ..lib.hook_context import HookContext, HookResult
+from ..lib.steps import run_steps
+from ..lib import fast_json
+from .before_registry_append import _release_registry_lock
+
+# Registry paths are fixed relative to the project root
+_RUNS_DIR = Path("docs") / "runs"
+_STATUS_FILE = _RUNS_DIR / "latest_status.json"
+_COMPLETION_LOG = _RUNS_DIR / "completion_log.jsonl"
+_RUN_ID_INDEX = _RUNS_DIR / "run_ids.idx"
+_NOTIFICATIONS_CONFIG = Path("tools") / "hooks" / "config" / "notifications.yaml"
 
 
 def execute(ctx: HookContext) -> HookResult:
@@ -21,6 +31,7 @@ def execute(ctx: HookContext) -> HookResult:
     - Console summary of run completion
     - Optional notifications (Telegram/Slack if configured)
     - Update lightweight status files
+    - Record run_id in the duplicate-check index
     - Release registry lock
     - Log completion metrics
     """
@@ -29,108 +40,27 @@ def execute(ctx: HookContext) -> HookResult:
     actions = []
     
     try:
-        # 1. Release registry lock (cleanup)
-        lock_file = os.path.join("docs", "runs", "registry.lock")
-        if os.path.exists(lock_file):
-            try:
-                # Verify this is our lock before removing
-                with open(lock_file, 'r') as f:
-                    lock_data = json.load(f)
-                
-                if lock_data.get('run_id') == ctx.run_id:
-                    os.remove(lock_file)
-                    actions.append("Registry lock released")
-                else:
-                    actions.append(f"Lock belongs to different run: {lock_data.get('run_id')}")
-            except (json.JSONDecodeError, OSError):
-                # Force remove stale lock
-                os.remove(lock_file)
-                actions.append("Stale registry lock removed")
-        else:
-            actions.append("No registry lock to release")
-        
-        # 2. Generate console summary
+        # 1. Record run_id in the duplicate-check index while the lock is held
+        #    (before_registry_append rebuilds the index from the CSV if missing)
         try:
-            summary = _generate_run_summary(ctx)
-            actions.append("Console summary generated")
-            
-            # Print to console (this is observability)
-            print("\n" + "="*60)
-            print("TRADING RUN COMPLETED")
-            print("="*60)
-            print(summary)
-            print("="*60 + "\n")
-            
-        except Exception as e:
-            actions.append(f"Console summary failed: {str(e)}")
-        
-        # 3. Update lightweight status file
-        try:
-            status_file = os.path.join("docs", "runs", "latest_status.json")
-            status_data = {
-                "latest_run_id": ctx.run_id,
-                "completion_time": ctx.timestamp.isoformat() if ctx.timestamp else None,
-                "phase": ctx.phase,
-                "universe": ctx.universe,
-                "date_range": f"{ctx.date_start} to {ctx.date_end}",
-                "config_hash": ctx.config_hash[:8] if ctx.config_hash else "unknown"
-            }
-            
-            with open(status_file, 'w') as f:
-                json.dump(status_data, f, indent=2)
-                
-            actions.append(f"Status file updated: {status_file}")
-            
-        except Exception as e:
-            actions.append(f"Status file update failed: {str(e)}")
+            if _RUN_ID_INDEX.exists():
+                with open(_RUN_ID_INDEX, 'ab') as f:
+                    f.write(ctx.run_id.encode() + b'\n')
+                actions.append("Run id index updated")
+        except OSError as e:
+            actions.append(f"Run id index update failed: {str(e)}")
         
-        # 4. Optional notifications (if configured)
-        notifications_sent = 0
-        try:
-            notifications_config = _load_notifications_config()
-            
-            if notifications_config:
-                # Telegram notification
-                if notifications_config.get('telegram', {}).get('enabled'):
-                    if _send_telegram_notification(ctx, summary if 'summary' in locals() else "Run completed"):
-                        notifications_sent += 1
-                        actions.append("Telegram notification sent")
-                    else:
-                        actions.append("Telegram notification failed")
-                
-                # Slack notification  
-                if notifications_config.get('slack', {}).get('enabled'):
-                    if _send_slack_notification(ctx, summary if 'summary' in locals() else "Run completed"):
-                        notifications_sent += 1
-                        actions.append("Slack notification sent")
-                    else:
-                        actions.append("Slack notification failed")
-            else:
-                actions.append("No notification config found")
-                
-        except Exception as e:
-            actions.append(f"Notifications failed: {str(e)}")
+        # 2. Release the registry flock() taken by before_registry_append
+        if getattr(ctx, 'registry_lock', None) is not None:
+            _release_registry_lock(ctx)
+            actions.append("Registry lock released")
+        else:
+            actions.append("No registry lock to release")
         
-        # 5. Log completion metrics
-        try:
-            completion_log = {
-                "run_id": ctx.run_id,
-                "completed_at": ctx.timestamp.isoformat() if ctx.timestamp else None,
-                "phase": ctx.phase,
-                "actions_completed": len(actions),
-                "notifications_sent": notifications_sent,
-                "universe": ctx.universe,
-                "config_hash": ctx.config_hash
-            }
-            
-            completion_file = os.path.join("docs", "runs", "completion_log.jsonl")
-            with open(completion_file, 'a') as f:
-                f.write(json.dumps(completion_log) + '\n')
-                
-            actions.append("Completion logged")
-            
-        except Exception as e:
-            actions.append(f"Completion logging failed: {str(e)}")
+        # 3-6. Console summary, status file, notifications, completion log
+        state = {"summary": "Run completed", "notifications_sent": 0, "actions": actions}
+        run_steps(_STEPS, ctx, state, actions)
+        notifications_sent = state["notifications_sent"]
         
         # Write hook log
         log_data = {
@@ -142,8 +72,7 @@ def execute(ctx: HookContext) -> HookResult:
             "timestamp": ctx.timestamp.isoformat() if ctx.timestamp else None
         }
         
-        with open(ctx.hook_log_path, 'w') as f:
-            json.dump(log_data, f, indent=2)
+        fast_json.write_file(ctx.hook_log_path, log_data)
         
         return HookResult(
             success=True,
@@ -164,11 +93,109 @@ def execute(ctx: HookContext) -> HookResult:
             details={
                 "exception": str(e),
                 "type": type(e).__name__,
-                "actions_completed": len(actions) if 'actions' in locals() else 0
+                "actions_completed": len(actions)
             }
         )
 
 
+def _step_console_summary(ctx: HookContext, state: Dict[str, Any]) -> Tuple[bool, str]:
+    """Generate the run summary and print it to the console"""
+    summary = _generate_run_summary(ctx)
+    state["summary"] = summary
+    
+    # Print to console (this is observability)
+    print("\n" + "="*60)
+    print("TRADING RUN COMPLETED")
+    print("="*60)
+    print(summary)
+    print("="*60 + "\n")
+    
+    return True, "Console summary generated"
+
+
+def _step_status_file(ctx: HookContext, state: Dict[str, Any]) -> Tuple[bool, str]:
+    """Update the lightweight latest_status.json file"""
+    status_file = _STATUS_FILE
+    status_data = {
+        "latest_run_id": ctx.run_id,
+        "completion_time": ctx.timestamp.isoformat() if ctx.timestamp else None,
+        "phase": ctx.phase,
+        "universe": ctx.universe,
+        "date_range": f"{ctx.date_start} to {ctx.date_end}",
+        "config_hash": ctx.config_hash[:8] if ctx.config_hash else "unknown"
+    }
+    
+    try:
+        # Atomic replace so dashboards polling this file never read partial JSON
+        fast_json.write_file_atomic(status_file, status_data, indent=True)
+    except OSError as e:
+        return False, f"Status file update failed: {str(e)}"
+        
+    return True, f"Status file updated: {status_file}"
+
+
+def _step_notifications(ctx: HookContext, state: Dict[str, Any]) -> Tuple[bool, str]:
+    """Send optional notifications (if configured)"""
+    notifications_config = _load_notifications_config()
+    
+    if not notifications_config:
+        return True, "No notification config found"
+    
+    summary = state["summary"]
+    results = []
+    all_sent = True
+    
+    # Telegram notification
+    if notifications_config.get('telegram', {}).get('enabled'):
+        if _send_telegram_notification(ctx, summary):
+            state["notifications_sent"] += 1
+            results.append("Telegram notification sent")
+        else:
+            all_sent = False
+            results.append("Telegram notification failed")
+    
+    # Slack notification  
+    if notifications_config.get('slack', {}).get('enabled'):
+        if _send_slack_notification(ctx, summary):
+            state["notifications_sent"] += 1
+            results.append("Slack notification sent")
+        else:
+            all_sent = False
+            results.append("Slack notification failed")
+    
+    return all_sent, "; ".join(results) or "No notifications enabled"
+
+
+def _step_completion_log(ctx: HookContext, state: Dict[str, Any]) -> Tuple[bool, str]:
+    """Append completion metrics to completion_log.jsonl"""
+    completion_log = {
+        "run_id": ctx.run_id,
+        "completed_at": ctx.timestamp.isoformat() if ctx.timestamp else None,
+        "phase": ctx.phase,
+        "actions_completed": len(state["actions"]),
+        "notifications_sent": state["notifications_sent"],
+        "universe": ctx.universe,
+        "config_hash": ctx.config_hash
+    }
+    
+    try:
+        with open(_COMPLETION_LOG, 'ab') as f:
+            f.write(fast_json.dumps_line(completion_log))
+    except OSError as e:
+        return False, f"Completion logging failed: {str(e)}"
+        
+    return True, "Completion logged"
+
+
+# Best-effort observability steps, run in order by execute()
+_STEPS = (
+    _step_console_summary,
+    _step_status_file,
+    _step_notifications,
+    _step_completion_log,
+)
+
+
 def _generate_run_summary(ctx: HookContext) -> str:
     """Generate a human-readable run summary"""
     summary_lines = [
@@ -201,18 +228,20 @@ def _generate_run_summary(ctx: HookContext) -> str:
 
 def _load_notifications_config() -> dict:
     """Load notifications configuration if it exists"""
-    config_file = os.path.join("tools", "hooks", "config", "notifications.yaml")
+    config_file = _NOTIFICATIONS_CONFIG
     
     if not os.path.exists(config_file):
         return {}
     
     try:
         import yaml
-        with open(config_file, 'r') as f:
-            return yaml.safe_load(f)
+        # Prefer the libyaml-backed loader; fall back to the pure-Python one
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        with open(config_file, 'rb') as f:
+            return yaml.load(f, Loader=loader)
     except ImportError:
         # YAML not available, try JSON fallback
-        json_config = config_file.replace('.yaml', '.json')
+        json_config = config_file.with_suffix('.json')
         if os.path.exists(json_config):
             with open(json_config, 'r') as f:
                 return json.load(f)
@@ -5,11 +5,33 @@ Ensure evaluator has what it needs and check for red flags from analyzer
 """
 
 import os
-import json
 import csv
 from pathlib import Path
 from typing import List, Dict, Any
 from ..lib.hook_context import HookContext, HookResult
+from ..lib import fast_json
+
+# Event type substrings that mark a critical red flag in events.csv
+_RED_FLAG_TOKENS = (
+    b'lookahead', b'future_data',
+    b'liquidity_violation', b'impossible_fill',
+    b'accounting_error', b'balance_mismatch'
+)
+
+# Event types shorter than the shortest token cannot be red flags
+_MIN_RED_FLAG_LEN = min(len(token) for token in _RED_FLAG_TOKENS)
+
+# Event files smaller than this are prefiltered with one read before CSV parsing
+_SMALL_EVENTS_FILE_BYTES = 16384
+
+# Metrics the evaluator cannot run without, in reporting order
+_REQUIRED_METRICS = (
+    'total_return', 'sharpe_ratio', 'sortino_ratio',
+    'max_drawdown', 'total_trades', 'win_rate'
+)
+
+# Metrics inspected for suspicious values, in unpacking order
+_SUSPICIOUS_CHECK_METRICS = ('sortino_ratio', 'total_trades', 'max_drawdown', 'win_rate')
 
 
 def execute(ctx: HookContext) -> HookResult:
@@ -62,8 +84,7 @@ def execute(ctx: HookContext) -> HookResult:
         # 2. Check manifest for analyzer completion status
         manifest_path = required_paths['manifest']
         try:
-            with open(manifest_path, 'r') as f:
-                manifest = json.load(f)
+            manifest = fast_json.load_file(manifest_path)
             
             # Check if analyzer completed successfully
             status = manifest.get('status', 'unknown')
@@ -79,7 +100,7 @@ def execute(ctx: HookContext) -> HookResult:
             if 'warnings' in manifest and len(manifest.get('warnings', [])) > 10:
                 red_flags.append(f"Analyzer reported {len(manifest['warnings'])} warnings (>10)")
                 
-        except (json.JSONDecodeError, KeyError) as e:
+        except (fast_json.JSONDecodeError, KeyError) as e:
             return HookResult(
                 success=False,
                 message=f"Invalid or incomplete manifest: {e}",
@@ -91,25 +112,32 @@ def execute(ctx: HookContext) -> HookResult:
         events_path = required_paths['events']
         try:
             red_flag_events = []
-            with open(events_path, 'r') as f:
-                reader = csv.DictReader(f)
-                for i, row in enumerate(reader):
-                    if i > 1000:  # Limit scan to first 1000 events for performance
-                        break
-                    
-                    event_type = row.get('event_type', '').lower()
-                    
-                    # Check for lookahead violations
-                    if 'lookahead' in event_type or 'future_data' in event_type:
-                        red_flag_events.append(f"Row {i+2}: {event_type}")
-                    
-                    # Check for liquidity violations  
-                    if 'liquidity_violation' in event_type or 'impossible_fill' in event_type:
-                        red_flag_events.append(f"Row {i+2}: {event_type}")
+            if _may_contain_red_flags(events_path):
+                with open(events_path, 'r', newline='') as f:
+                    reader = csv.reader(f)
+                    header = next(reader, [])
+                    et_idx = header.index('event_type') if 'event_type' in header else None
                     
-                    # Check for accounting errors
-                    if 'accounting_error' in event_type or 'balance_mismatch' in event_type:
-                        red_flag_events.append(f"Row {i+2}: {event_type}")
+                    for i, row in enumerate(reader if et_idx is not None else ()):
+                        if i > 1000:  # Limit scan to first 1000 events for performance
+                            break
+                        
+                        event_type = row[et_idx] if len(row) > et_idx else ''
+                        if len(event_type) < _MIN_RED_FLAG_LEN:
+                            continue
+                        event_type = event_type.lower()
+                        
+                        # Check for lookahead violations
+                        if 'lookahead' in event_type or 'future_data' in event_type:
+                            red_flag_events.append(f"Row {i+2}: {event_type}")
+                        
+                        # Check for liquidity violations  
+                        if 'liquidity_violation' in event_type or 'impossible_fill' in event_type:
+                            red_flag_events.append(f"Row {i+2}: {event_type}")
+                        
+                        # Check for accounting errors
+                        if 'accounting_error' in event_type or 'balance_mismatch' in event_type:
+                            red_flag_events.append(f"Row {i+2}: {event_type}")
             
             if red_flag_events:
                 if len(red_flag_events) > 5:
@@ -135,15 +163,9 @@ def execute(ctx: HookContext) -> HookResult:
         # 4. Validate metrics.json has required fields for evaluation
         metrics_path = required_paths['metrics']
         try:
-            with open(metrics_path, 'r') as f:
-                metrics = json.load(f)
+            metrics = fast_json.load_file(metrics_path)
             
-            required_metrics = [
-                'total_return', 'sharpe_ratio', 'sortino_ratio', 
-                'max_drawdown', 'total_trades', 'win_rate'
-            ]
-            
-            missing_metrics = [metric for metric in required_metrics if metric not in metrics]
+            missing_metrics = [m for m in _REQUIRED_METRICS if m not in metrics]
             if missing_metrics:
                 return HookResult(
                     success=False,
@@ -154,20 +176,19 @@ def execute(ctx: HookContext) -> HookResult:
             
             # Check for suspicious metric values that might indicate problems
             suspicious = []
+            sortino, total_trades, max_dd, win_rate = (
+                metrics.get(key, 0) for key in _SUSPICIOUS_CHECK_METRICS
+            )
             
             # Unrealistically high Sortino ratio
-            sortino = metrics.get('sortino_ratio', 0)
             if isinstance(sortino, (int, float)) and sortino > 5.0:
                 suspicious.append(f"Sortino ratio: {sortino:.2f} (>5.0 suspicious)")
             
             # Zero drawdown with significant trading
-            total_trades = metrics.get('total_trades', 0)
-            max_dd = metrics.get('max_drawdown', 0)
             if total_trades > 10 and max_dd == 0:
                 suspicious.append(f"Zero drawdown with {total_trades} trades (suspicious)")
             
             # Win rate outside realistic bounds
-            win_rate = metrics.get('win_rate', 0)
             if isinstance(win_rate, (int, float)):
                 if win_rate > 0.95 or win_rate < 0.05:
                     suspicious.append(f"Win rate: {win_rate:.2%} (outside 5%-95% bounds)")
@@ -177,7 +198,7 @@ def execute(ctx: HookContext) -> HookResult:
             
             checks.append(f"Metrics: all required fields present")
             
-        except (json.JSONDecodeError, TypeError) as e:
+        except (fast_json.JSONDecodeError, TypeError, AttributeError) as e:
             return HookResult(
                 success=False,
                 message=f"Error validating metrics: {e}",
@@ -230,8 +251,7 @@ def execute(ctx: HookContext) -> HookResult:
             "timestamp": ctx.timestamp.isoformat() if ctx.timestamp else None
         }
         
-        with open(ctx.hook_log_path, 'w') as f:
-            json.dump(log_data, f, indent=2)
+        fast_json.write_file(ctx.hook_log_path, log_data)
         
         message = f"Evaluator readiness validated ({len(checks)} checks passed)"
         if red_flags:
@@ -257,6 +277,22 @@ def execute(ctx: HookContext) -> HookResult:
         )
 
 
+def _may_contain_red_flags(events_path: str) -> bool:
+    """
+    Cheap prefilter for the events scan
+    
+    Small files are read once and searched for any red flag token; if none
+    occurs anywhere in the file the per-row CSV scan can be skipped. Larger
+    files always go through the full scan.
+    """
+    if os.path.getsize(events_path) >= _SMALL_EVENTS_FILE_BYTES:
+        return True
+    
+    with open(events_path, 'rb') as f:
+        data = f.read().lower()
+    return any(token in data for token in _RED_FLAG_TOKENS)
+
+
 if __name__ == "__main__":
     # Test hook with dummy context
     test_ctx = HookContext(
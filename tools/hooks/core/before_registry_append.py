@@ -4,14 +4,54 @@ before_registry_append hook - P0 blocking
 Ensure CSV/lock integrity before appending to run registry
 """
 
+import io
 import os
+import re
 import csv
-import json
+import mmap
 import time
 import fcntl
+import weakref
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 from ..lib.hook_context import HookContext, HookResult
+from ..lib import fast_json
+
+# Registry columns, in order
+_REGISTRY_HEADERS = (
+    'run_id', 'config_hash', 'engine_version', 'universe', 'date_start',
+    'date_end', 'seed', 'status', 'total_return', 'sharpe_ratio',
+    'max_drawdown', 'total_trades', 'start_time', 'end_time',
+    'duration_minutes', 'notes'
+)
+# Columns a non-standard registry header must still provide
+_ESSENTIAL_HEADERS = ('run_id', 'config_hash', 'status')
+
+# Header row written to a new registry (csv.writer line ending). An existing
+# registry whose first line matches it byte-for-byte is accepted without CSV
+# parsing.
+_EXPECTED_HEADER = ','.join(_REGISTRY_HEADERS).encode()
+_EXPECTED_HEADER_LINE = _EXPECTED_HEADER + b"\r\n"
+
+# Registry paths are fixed relative to the project root
+_RUNS_DIR = Path("docs") / "runs"
+_REGISTRY_FILE = _RUNS_DIR / "run_registry.csv"
+_RUN_ID_INDEX = _RUNS_DIR / "run_ids.idx"
+
+# Constant part of the success details; copied and completed per call
+_DETAILS_TEMPLATE = {
+    "lock_file": str(_REGISTRY_FILE),
+    "registry_file": str(_REGISTRY_FILE)
+}
+
+# How long to wait for another writer to release the registry, and how often
+# to retry the non-blocking lock meanwhile
+_LOCK_TIMEOUT_SECONDS = 300
+_LOCK_POLL_INTERVAL = 0.1
+
+# run_id is the first CSV column and never contains commas or line breaks.
+# Only used on registries without quoted cells, where every line is a row.
+_RUN_ID_RE = re.compile(rb'^[^,\r\n]+', re.MULTILINE)
 
 
 def execute(ctx: HookContext) -> HookResult:
@@ -22,172 +62,84 @@ def execute(ctx: HookContext) -> HookResult:
     - Registry file exists and is accessible
     - CSV headers are correct
     - No duplicate run_id already exists
-    - Acquire exclusive lock for write operation
+    - Acquire exclusive flock() on the registry for the write operation
     """
     
     ctx.ensure_hook_dir()
+    ts_iso = ctx.timestamp.isoformat() if ctx.timestamp else None
     checks = []
     
     try:
-        # Registry file paths
-        registry_file = os.path.join("docs", "runs", "run_registry.csv")
-        lock_file = os.path.join("docs", "runs", "registry.lock")
-        
-        # Ensure registry directory exists
-        os.makedirs(os.path.dirname(registry_file), exist_ok=True)
-        
-        # 1. Check if registry file exists, create with headers if not
-        if not os.path.exists(registry_file):
-            headers = [
-                'run_id', 'config_hash', 'engine_version', 'universe', 
-                'date_start', 'date_end', 'seed', 'status', 'total_return',
-                'sharpe_ratio', 'max_drawdown', 'total_trades', 'start_time',
-                'end_time', 'duration_minutes', 'notes'
-            ]
-            
-            with open(registry_file, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(headers)
-            
-            checks.append("Registry: created new file with headers")
-        else:
-            checks.append("Registry: file exists")
+        registry_file = str(_REGISTRY_FILE)
+        lock_file = registry_file  # flock()ed directly, no separate lock file
         
-        # 2. Validate CSV structure and headers
+        # 1. Open the registry once (created if missing) and take an exclusive
+        #    lock on it, retrying for up to 5 minutes while another writer
+        #    holds it. The lock is dropped automatically if the holding
+        #    process dies, so there is no stale-lock handling. All checks below
+        #    run on this handle, and opening for append is the write test.
         try:
-            with open(registry_file, 'r') as f:
-                reader = csv.reader(f)
-                headers = next(reader)  # Read header row
-                
-                expected_headers = [
-                    'run_id', 'config_hash', 'engine_version', 'universe',
-                    'date_start', 'date_end', 'seed', 'status', 'total_return',
-                    'sharpe_ratio', 'max_drawdown', 'total_trades', 'start_time',
-                    'end_time', 'duration_minutes', 'notes'
-                ]
-                
-                # Check if we have at least the essential headers
-                essential_headers = ['run_id', 'config_hash', 'status']
-                missing_essential = [h for h in essential_headers if h not in headers]
-                
-                if missing_essential:
-                    return HookResult(
-                        success=False,
-                        message=f"Registry missing essential headers: {missing_essential}",
-                        priority="P0",
-                        should_halt=True
-                    )
-                
-                checks.append(f"Registry: valid headers ({len(headers)} columns)")
-                
-                # 3. Check for duplicate run_id
-                duplicate_found = False
-                row_count = 0
-                for row in reader:
-                    row_count += 1
-                    if len(row) > 0 and row[0] == ctx.run_id:  # Assuming run_id is first column
-                        duplicate_found = True
-                        break
-                
-                if duplicate_found:
-                    return HookResult(
-                        success=False,
-                        message=f"Duplicate run_id found in registry: {ctx.run_id}",
-                        priority="P0",
-                        should_halt=True
-                    )
-                
-                checks.append(f"Registry: no duplicate run_id found ({row_count} existing records)")
-                
-        except (OSError, csv.Error) as e:
+            try:
+                registry = open(_REGISTRY_FILE, 'a+b')
+            except FileNotFoundError:
+                # First run: create the registry directory, then retry
+                _RUNS_DIR.mkdir(parents=True, exist_ok=True)
+                registry = open(_REGISTRY_FILE, 'a+b')
+        except OSError as e:
             return HookResult(
                 success=False,
-                message=f"Error reading registry file: {e}",
+                message=f"Registry file not writable: {e}",
                 priority="P0",
                 should_halt=True
             )
         
-        # 4. Acquire exclusive lock
-        lock_acquired = False
-        max_retries = 300  # 5 minutes with 1-second intervals
-        retry_count = 0
-        
-        while not lock_acquired and retry_count < max_retries:
-            try:
-                # Try to create lock file exclusively
-                lock_fd = os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
-                
-                # Write lock info
-                lock_info = {
-                    "run_id": ctx.run_id,
-                    "phase": ctx.phase,
-                    "timestamp": ctx.timestamp.isoformat() if ctx.timestamp else None,
-                    "pid": os.getpid()
-                }
-                
-                os.write(lock_fd, json.dumps(lock_info, indent=2).encode())
-                os.close(lock_fd)
-                
-                lock_acquired = True
-                checks.append(f"Lock: acquired after {retry_count} retries")
-                
-                # Store lock file path for cleanup
-                ctx.lock_file = lock_file
-                
-            except FileExistsError:
-                # Lock exists, check if it's stale
-                if os.path.exists(lock_file):
-                    try:
-                        lock_age = time.time() - os.path.getmtime(lock_file)
-                        if lock_age > 600:  # 10 minutes - consider stale
-                            os.remove(lock_file)
-                            checks.append(f"Lock: removed stale lock (age: {lock_age:.1f}s)")
-                            continue
-                    except (OSError, FileNotFoundError):
-                        pass
-                
-                retry_count += 1
-                if retry_count % 30 == 0:  # Log every 30 seconds
-                    checks.append(f"Lock: waiting... ({retry_count}/300 retries)")
-                time.sleep(1)
-            
-            except OSError as e:
-                return HookResult(
-                    success=False,
-                    message=f"Error acquiring registry lock: {e}",
-                    priority="P0",
-                    should_halt=True
-                )
+        try:
+            waited = _acquire_registry_lock(registry)
+        except OSError as e:
+            registry.close()
+            return HookResult(
+                success=False,
+                message=f"Error acquiring registry lock: {e}",
+                priority="P0",
+                should_halt=True
+            )
         
-        if not lock_acquired:
+        if waited is None:
+            registry.close()
             return HookResult(
                 success=False,
-                message=f"Failed to acquire registry lock after {max_retries} retries (5 minutes)",
-                priority="P0", 
+                message=f"Failed to acquire registry lock after {_LOCK_TIMEOUT_SECONDS} seconds ({_LOCK_TIMEOUT_SECONDS // 60} minutes)",
+                priority="P0",
                 should_halt=True
             )
+        checks.append(f"Lock: acquired after waiting {waited:.1f}s" if waited else "Lock: acquired")
         
-        # 5. Validate we can write to the registry (test append)
+        # Hand the locked handle to after_registry_append for release. If that
+        # hook never runs (failed append, halt in between), the lock is still
+        # released once the context is discarded, or at interpreter exit.
+        ctx.lock_file = lock_file
+        ctx.registry_lock = registry
         try:
-            with open(registry_file, 'a') as f:
-                # Just test that we can open for append, don't write anything yet
-                pass
-            checks.append("Registry: writable for append")
-        except (OSError, PermissionError) as e:
-            # Release lock before failing
-            if os.path.exists(lock_file):
-                try:
-                    os.remove(lock_file)
-                except:
-                    pass
-            
-            return HookResult(
+            weakref.finalize(ctx, _unlock_registry, registry)
+        except TypeError:
+            pass  # Context type without weakref support
+        checks.append("Registry: writable for append")
+        
+        # 2-3. Validate headers and check for a duplicate run_id
+        try:
+            failure = _validate_registry(registry, ctx, checks)
+        except (OSError, csv.Error) as e:
+            failure = HookResult(
                 success=False,
-                message=f"Registry file not writable: {e}",
+                message=f"Error reading registry file: {e}",
                 priority="P0",
                 should_halt=True
             )
         
+        if failure is not None:
+            _release_registry_lock(ctx)
+            return failure
+        
         # Write success log
         log_data = {
             "hook": "before_registry_append",
@@ -196,34 +148,24 @@ def execute(ctx: HookContext) -> HookResult:
             "lock_file": lock_file,
             "registry_file": registry_file,
             "checks": checks,
-            "timestamp": ctx.timestamp.isoformat() if ctx.timestamp else None
+            "timestamp": ts_iso
         }
         
-        with open(ctx.hook_log_path, 'w') as f:
-            json.dump(log_data, f, indent=2)
+        fast_json.write_file_atomic(ctx.hook_log_path, log_data)
+        
+        details = _DETAILS_TEMPLATE.copy()
+        details["checks"] = checks
         
         return HookResult(
             success=True,
             message=f"Registry ready for append (lock acquired, {len(checks)} checks passed)",
             priority="P0",
-            details={
-                "checks": checks,
-                "lock_file": lock_file,
-                "registry_file": registry_file
-            }
+            details=details
         )
         
     except Exception as e:
-        # Clean up lock if we created it
-        lock_file = os.path.join("docs", "runs", "registry.lock")
-        if os.path.exists(lock_file):
-            try:
-                with open(lock_file, 'r') as f:
-                    lock_data = json.load(f)
-                if lock_data.get('run_id') == ctx.run_id:
-                    os.remove(lock_file)
-            except:
-                pass
+        # Release the lock if we acquired it
+        _release_registry_lock(ctx)
         
         return HookResult(
             success=False,
@@ -234,6 +176,144 @@ def execute(ctx: HookContext) -> HookResult:
         )
 
 
+def _validate_registry(registry, ctx: HookContext, checks: List[str]) -> Optional[HookResult]:
+    """
+    Validate headers and check for a duplicate run_id on the locked handle
+    
+    Writes the header row if the registry is empty. Returns a failing
+    HookResult, or None when the registry is ready for append.
+    """
+    registry.seek(0)
+    first_line = registry.readline()
+    
+    if not first_line:
+        registry.write(_EXPECTED_HEADER_LINE)
+        registry.flush()
+        checks.append("Registry: created new file with headers")
+        column_count = len(_REGISTRY_HEADERS)
+    else:
+        checks.append("Registry: file exists")
+        
+        if first_line.rstrip(b'\r\n') == _EXPECTED_HEADER:
+            column_count = len(_REGISTRY_HEADERS)
+        else:
+            # Non-standard header: parse it and require the essential columns
+            headers = next(csv.reader([first_line.decode('utf-8')]), [])
+            header_set = set(headers)
+            
+            if not header_set.issuperset(_ESSENTIAL_HEADERS):
+                missing_essential = [h for h in _ESSENTIAL_HEADERS if h not in header_set]
+                return HookResult(
+                    success=False,
+                    message=f"Registry missing essential headers: {missing_essential}",
+                    priority="P0",
+                    should_halt=True
+                )
+            column_count = len(headers)
+    
+    checks.append(f"Registry: valid headers ({column_count} columns)")
+    
+    # Header only (typically just created): nothing can be a duplicate. The
+    # index is reset so entries from a replaced registry cannot match.
+    if os.fstat(registry.fileno()).st_size <= registry.tell():
+        open(_RUN_ID_INDEX, 'wb').close()
+        checks.append("Registry: empty, no duplicate check needed")
+        return None
+    
+    existing_run_ids = _load_run_id_index(registry)
+    
+    if ctx.run_id.encode() in existing_run_ids:
+        return HookResult(
+            success=False,
+            message=f"Duplicate run_id found in registry: {ctx.run_id}",
+            priority="P0",
+            should_halt=True
+        )
+    
+    checks.append(f"Registry: no duplicate run_id found ({len(existing_run_ids)} existing records)")
+    return None
+
+
+def _load_run_id_index(registry) -> set:
+    """
+    Load the set of registered run_ids (as bytes) from the index sidecar
+    
+    run_ids.idx holds one run_id per line and is appended to by
+    after_registry_append once a row has been written. The index is rebuilt
+    from the rows after the header (run_id is the first column) whenever it
+    is missing or older than the registry, e.g. after a manual edit. The
+    rebuild scans an mmap of the registry with a compiled regex, so the
+    rows are never copied into Python strings. A registry containing a
+    quote character may have quoted cells spanning lines (multi-line notes),
+    so it is parsed with csv.reader instead.
+    """
+    try:
+        if os.stat(_RUN_ID_INDEX).st_mtime_ns >= os.fstat(registry.fileno()).st_mtime_ns:
+            with open(_RUN_ID_INDEX, 'rb') as f:
+                run_ids = set(f.read().split(b'\n'))
+            run_ids.discard(b'')
+            return run_ids
+    except FileNotFoundError:
+        pass
+    
+    # The handle is positioned just past the header line
+    start = registry.tell()
+    with mmap.mmap(registry.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if mm.find(b'"', start) == -1:
+            run_ids = _RUN_ID_RE.findall(mm, start)
+        else:
+            rows = csv.reader(io.StringIO(mm[start:].decode('utf-8'), newline=''))
+            run_ids = [row[0].encode() for row in rows if row and row[0]]
+    
+    with open(_RUN_ID_INDEX, 'wb') as f:
+        f.write(b''.join(run_id + b'\n' for run_id in run_ids))
+    
+    return set(run_ids)
+
+
+def _acquire_registry_lock(registry) -> Optional[float]:
+    """
+    Take an exclusive flock() on the registry handle
+    
+    Polls the non-blocking lock every _LOCK_POLL_INTERVAL seconds until
+    _LOCK_TIMEOUT_SECONDS have passed, so a contended acquire waits 50 ms
+    past the release on average. A blocking flock() cannot time out, and
+    releasing a flock() is not a filesystem event inotify could wait on.
+    Returns the seconds spent waiting, or None if the lock was not acquired.
+    """
+    start = time.monotonic()
+    waited = 0.0
+    
+    while True:
+        try:
+            fcntl.flock(registry.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return waited
+        except BlockingIOError:
+            waited = time.monotonic() - start
+            if waited >= _LOCK_TIMEOUT_SECONDS:
+                return None
+            time.sleep(_LOCK_POLL_INTERVAL)
+
+
+def _unlock_registry(lock_handle) -> None:
+    """Unlock and close a registry handle, unless it is already closed"""
+    if lock_handle.closed:
+        return
+    try:
+        fcntl.flock(lock_handle.fileno(), fcntl.LOCK_UN)
+    except OSError:
+        pass
+    lock_handle.close()
+
+
+def _release_registry_lock(ctx: HookContext) -> None:
+    """Unlock and close the registry handle acquired by execute(), if any"""
+    lock_handle = getattr(ctx, 'registry_lock', None)
+    if lock_handle is not None:
+        _unlock_registry(lock_handle)
+        ctx.registry_lock = None
+
+
 if __name__ == "__main__":
     # Test hook with dummy context
     test_ctx = HookContext(
@@ -247,11 +327,5 @@ if __name__ == "__main__":
     print(f"Result: {result.success}")
     print(f"Message: {result.message}")
     
-    # Clean up test lock
-    lock_file = os.path.join("docs", "runs", "registry.lock")
-    if os.path.exists(lock_file):
-        try:
-            os.remove(lock_file)
-            print("Cleaned up test lock file")
-        except:
-            print("Could not clean up test lock file")
\ No newline at end of file
+    # Release test lock
+    _release_registry_lock(test_ctx)
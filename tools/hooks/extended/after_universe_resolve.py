@@ -5,9 +5,36 @@ Emit resolved symbol count and warnings after universe resolution
 """
 
 import os
+import re
+import sys
 import json
-from typing import Dict, Any
+import hashlib
+import functools
+from collections import Counter
+from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Optional, Tuple
 from ..lib.hook_context import HookContext, HookResult
+from ..lib import fast_json
+
+# Known quote currencies, longest first so e.g. USDT wins over USD
+COMMON_QUOTES_SORTED = sorted(['USDT', 'BTC', 'ETH', 'BNB', 'BUSD', 'USDC', 'USD', 'EUR'],
+                              key=len, reverse=True)
+# Single anchored alternation; the leftmost match is the longest known suffix
+_QUOTE_RE = re.compile('(' + '|'.join(COMMON_QUOTES_SORTED) + ')$')
+_CONSOLE_RULE = "-" * 50
+# Fallback guess for unknown quotes: a 4-letter tail, else a 3-letter one,
+# with at least one base-asset character in front of it
+_ALPHA_TAIL_RE = re.compile(r'(?<=.)[A-Za-z]{3,4}$')
+
+
+@dataclass(frozen=True, slots=True)
+class QuoteComposition:
+    """Quote-currency breakdown of a resolved universe"""
+    quote_currencies: List[str]
+    quote_distribution: Dict[str, int]
+    most_common_quote: str
+    most_common_count: int
+    quote_diversity: int
 
 
 def execute(ctx: HookContext) -> HookResult:
@@ -22,6 +49,7 @@ def execute(ctx: HookContext) -> HookResult:
     """
     
     ctx.ensure_hook_dir()
+    ts_iso = ctx.timestamp.isoformat() if ctx.timestamp else None
     actions = []
     warnings = []
     
@@ -46,7 +74,9 @@ def execute(ctx: HookContext) -> HookResult:
                 actions.append("Loaded resolved universe data")
         
         symbol_count = universe_data.get('symbol_count', 0)
-        source_type = universe_data.get('source_type', 'unknown')
+        # Interned so the 'binance' comparison and the repeated dict values
+        # below share one object
+        source_type = sys.intern(universe_data.get('source_type', 'unknown'))
         symbols = universe_data.get('symbols', [])
         
         # Generate summary
@@ -65,47 +95,43 @@ def execute(ctx: HookContext) -> HookResult:
         if symbol_count > 500:
             warnings.append(f"High symbol count: {symbol_count} > 500 (may impact performance)")
         
-        # Analyze symbol composition (for supported exchanges)
-        if source_type == 'binance' and symbols:
-            composition = _analyze_symbol_composition(symbols)
-            summary_lines.append(f"Quote currencies: {', '.join(composition['quote_currencies'])}")
-            summary_lines.append(f"Most common quote: {composition['most_common_quote']} ({composition['most_common_count']} symbols)")
+        # Analyze symbol composition once; reused for the summary file
+        composition = _analyze_symbol_composition(tuple(symbols))
+        
+        # Report composition details (for supported exchanges)
+        if source_type == 'binance' and composition is not None:
+            summary_lines += (
+                f"Quote currencies: {', '.join(composition.quote_currencies)}",
+                f"Most common quote: {composition.most_common_quote} ({composition.most_common_count} symbols)",
+            )
             
-            if composition['most_common_count'] / symbol_count > 0.9:
-                warnings.append(f"Highly concentrated in {composition['most_common_quote']}: {composition['most_common_count']}/{symbol_count} symbols")
+            if composition.most_common_count / symbol_count > 0.9:
+                warnings.append(f"Highly concentrated in {composition.most_common_quote}: {composition.most_common_count}/{symbol_count} symbols")
         
         # Check for any resolution warnings
         if 'warnings' in universe_data and universe_data['warnings']:
             warnings.extend(universe_data['warnings'])
         
-        # Print console summary (observability)
-        print("\n" + "-" * 50)
-        print("UNIVERSE RESOLUTION SUMMARY")
-        print("-" * 50)
-        for line in summary_lines:
-            print(line)
-        
-        if warnings:
-            print("\nWarnings:")
-            for warning in warnings:
-                print(f"  • {warning}")
-        print("-" * 50 + "\n")
+        # Print console summary (observability) as a single write; callers
+        # running many resolutions can silence it with ctx.verbose = False
+        if getattr(ctx, 'verbose', True):
+            sys.stdout.write(_format_console_block(summary_lines, warnings))
         
         # Write summary to file
         summary_file = os.path.join(ctx.run_path, "universe_summary.json")
         summary_data = {
             "symbol_count": symbol_count,
             "source_type": source_type,
-            "composition": _analyze_symbol_composition(symbols) if symbols else {},
+            "composition": asdict(composition) if composition is not None else {},
             "warnings": warnings,
             "summary": summary_lines,
-            "timestamp": ctx.timestamp.isoformat() if ctx.timestamp else None
+            "timestamp": ts_iso
         }
         
-        with open(summary_file, 'w') as f:
-            json.dump(summary_data, f, indent=2)
-        
-        actions.append(f"Summary written to {summary_file}")
+        if _write_summary_if_changed(summary_file, summary_data):
+            actions.append(f"Summary written to {summary_file}")
+        else:
+            actions.append("Summary unchanged, skipped write")
         
         # Write hook log
         log_data = {
@@ -116,11 +142,10 @@ def execute(ctx: HookContext) -> HookResult:
             "warnings_count": len(warnings),
             "actions": actions,
             "summary": summary_lines,
-            "timestamp": ctx.timestamp.isoformat() if ctx.timestamp else None
+            "timestamp": ts_iso
         }
         
-        with open(ctx.hook_log_path, 'w') as f:
-            json.dump(log_data, f, indent=2)
+        fast_json.write_file_atomic(ctx.hook_log_path, log_data)
         
         message = f"Universe summary: {symbol_count} {source_type} symbols"
         if warnings:
@@ -148,6 +173,45 @@ def execute(ctx: HookContext) -> HookResult:
         )
 
 
+def _format_console_block(summary_lines: list, warnings: list) -> str:
+    """Render the console summary block as one string"""
+    block = f"\n{_CONSOLE_RULE}\nUNIVERSE RESOLUTION SUMMARY\n{_CONSOLE_RULE}\n"
+    block += "\n".join(summary_lines) + "\n"
+    if warnings:
+        block += "\nWarnings:\n" + "".join(f"  • {warning}\n" for warning in warnings)
+    return block + f"{_CONSOLE_RULE}\n\n"
+
+
+def _write_summary_if_changed(summary_file: str, summary_data: Dict[str, Any]) -> bool:
+    """
+    Write universe_summary.json unless its content is unchanged
+    
+    A blake2b digest of the summary (minus its timestamp) is kept in a
+    .digest sidecar; when it matches and the summary file is present the
+    write is skipped. Returns True if the summary was written.
+    """
+    content = {k: v for k, v in summary_data.items() if k != "timestamp"}
+    digest = hashlib.blake2b(fast_json.dumps(content), digest_size=16).digest()
+    digest_file = summary_file + ".digest"
+    
+    try:
+        with open(digest_file, 'rb') as f:
+            if f.read(16) == digest and os.path.exists(summary_file):
+                return False
+    except OSError:
+        pass
+    
+    # Human-facing, so pretty-printed, but serialized and written in one go
+    fast_json.write_file_atomic(summary_file, summary_data, indent=True)
+    
+    tmp_path = f"{digest_file}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(digest)
+    os.replace(tmp_path, digest_file)
+    
+    return True
+
+
 def _parse_universe_from_context(ctx: HookContext) -> Dict[str, Any]:
     """Parse universe data directly from context when resolved file not available"""
     
@@ -167,51 +231,44 @@ def _parse_universe_from_context(ctx: HookContext) -> Dict[str, Any]:
     }
 
 
-def _analyze_symbol_composition(symbols: list) -> Dict[str, Any]:
-    """Analyze the composition of trading symbols"""
+@functools.lru_cache(maxsize=64)
+def _analyze_symbol_composition(symbols: Tuple[str, ...]) -> Optional[QuoteComposition]:
+    """
+    Analyze the composition of trading symbols
+    
+    Memoized on the symbol tuple, so callers must treat the returned
+    composition (including its list and dict fields) as read-only. Returns
+    None for an empty universe.
+    """
     
     if not symbols:
-        return {}
+        return None
+    
+    # Fast path: USDT-only universes are the common case and need no regex
+    if all(symbol.endswith('USDT') for symbol in symbols):
+        return QuoteComposition(["USDT"], {"USDT": len(symbols)}, "USDT", len(symbols), 1)
     
     # Extract quote currencies (assuming Binance format)
-    quote_currencies = {}
-    common_quotes = ['USDT', 'BTC', 'ETH', 'BNB', 'BUSD', 'USDC', 'USD', 'EUR']
+    quote_currencies = Counter()
+    quote_search = _QUOTE_RE.search
+    tail_search = _ALPHA_TAIL_RE.search
     
     for symbol in symbols:
-        quote = None
-        for common_quote in sorted(common_quotes, key=len, reverse=True):  # Check longest first
-            if symbol.endswith(common_quote):
-                quote = common_quote
-                break
-        
-        if quote:
-            quote_currencies[quote] = quote_currencies.get(quote, 0) + 1
-        else:
-            # Try to guess quote currency (last 3-6 chars)
-            for length in [4, 3, 5, 6]:  # USDT, BTC, BUSD, etc.
-                if len(symbol) > length:
-                    potential_quote = symbol[-length:]
-                    if potential_quote.isalpha():
-                        quote_currencies[potential_quote] = quote_currencies.get(potential_quote, 0) + 1
-                        break
+        match = quote_search(symbol) or tail_search(symbol)
+        if match:
+            quote_currencies[match.group()] += 1
     
     if quote_currencies:
-        most_common_quote = max(quote_currencies.items(), key=lambda x: x[1])
-        return {
-            "quote_currencies": list(quote_currencies.keys()),
-            "quote_distribution": quote_currencies,
-            "most_common_quote": most_common_quote[0],
-            "most_common_count": most_common_quote[1],
-            "quote_diversity": len(quote_currencies)
-        }
+        most_common_quote, most_common_count = quote_currencies.most_common(1)[0]
+        return QuoteComposition(
+            quote_currencies=list(quote_currencies.keys()),
+            quote_distribution=dict(quote_currencies),
+            most_common_quote=most_common_quote,
+            most_common_count=most_common_count,
+            quote_diversity=len(quote_currencies)
+        )
     else:
-        return {
-            "quote_currencies": [],
-            "quote_distribution": {},
-            "most_common_quote": "unknown",
-            "most_common_count": 0,
-            "quote_diversity": 0
-        }
+        return QuoteComposition([], {}, "unknown", 0, 0)
 
 
 if __name__ == "__main__":
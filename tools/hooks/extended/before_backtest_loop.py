@@ -5,9 +5,53 @@ Safety ceilings and validation before backtest execution begins
 """
 
 import os
-import json
-from typing import Dict, Any
+import functools
+from datetime import date, datetime
+from typing import Dict, Any, List, Optional
 from ..lib.hook_context import HookContext, HookResult
+from ..lib import fast_json
+
+# Defaults for safety parameters missing from the config sections
+_RISK_DEFAULTS = {
+    'max_concurrent_positions': 'unlimited',
+    'max_position_size_pct': None,
+    'max_portfolio_heat_pct': None,
+    'stop_loss_method': None,
+    'take_profit_method': None
+}
+_EXECUTION_DEFAULTS = {
+    'max_leverage': 1.0,
+    'min_notional': None
+}
+
+# Range-checked safety limits, applied in order:
+# (key, is_invalid, invalid message, warn above, warning, check, missing warning)
+# Messages are formatted with the value. A missing warning of None means the
+# key always has a value (its default).
+_RISK_LIMIT_CHECKS = (
+    ('max_position_size_pct', lambda v: v <= 0 or v > 100,
+     "Invalid max_position_size_pct: {}% (must be 0-100)",
+     20, "High position size limit: {}% (>20% risky)",
+     "Max position size: {}% of equity", "Max position size not specified"),
+    ('max_portfolio_heat_pct', lambda v: v <= 0 or v > 100,
+     "Invalid max_portfolio_heat_pct: {}% (must be 0-100)",
+     25, "High portfolio heat limit: {}% (>25% very risky)",
+     "Max portfolio heat: {}%", "Max portfolio heat not specified"),
+)
+_EXECUTION_LIMIT_CHECKS = (
+    ('max_leverage', lambda v: v < 1.0,
+     "Invalid max_leverage: {} (must be ≥ 1.0)",
+     10.0, "High leverage: {}x (>10x very risky)",
+     "Max leverage: {}x", None),
+    ('min_notional', lambda v: v <= 0,
+     "Invalid min_notional: {} (must be > 0)",
+     None, None,
+     "Min notional: {}", "Min notional not specified"),
+)
+
+# Shared fallback configs, after the run-specific candidates
+_BASE_CONFIG = os.path.join("configs", "base_config.json")
+_DEFAULT_CONFIG = os.path.join("configs", "default_config.json")
 
 
 def execute(ctx: HookContext) -> HookResult:
@@ -24,6 +68,7 @@ def execute(ctx: HookContext) -> HookResult:
     """
     
     ctx.ensure_hook_dir()
+    run_path = ctx.run_path
     checks = []
     warnings = []
     
@@ -40,12 +85,13 @@ def execute(ctx: HookContext) -> HookResult:
             )
         
         # Extract safety parameters
-        risk_mgmt = config_data.get('risk_management', {})
-        execution = config_data.get('execution', {})
+        risk_mgmt = {**_RISK_DEFAULTS, **config_data.get('risk_management', {})}
+        execution = {**_EXECUTION_DEFAULTS, **config_data.get('execution', {})}
         universe_info = _get_universe_info(ctx)
+        date_range_days = _calculate_date_range_days(ctx)
         
         # 1. Maximum concurrent positions check
-        max_positions = risk_mgmt.get('max_concurrent_positions', 'unlimited')
+        max_positions = risk_mgmt['max_concurrent_positions']
         symbol_count = universe_info.get('symbol_count', 0)
         
         if isinstance(max_positions, int):
@@ -54,90 +100,34 @@ def execute(ctx: HookContext) -> HookResult:
             elif max_positions > 100:
                 warnings.append(f"Max positions very high: {max_positions}")
             elif max_positions < 1:
-                return HookResult(
-                    success=False,
-                    message=f"Invalid max_concurrent_positions: {max_positions} (must be ≥ 1)",
-                    priority="P0",
-                    should_halt=True
-                )
+                return _halt(f"Invalid max_concurrent_positions: {max_positions} (must be ≥ 1)")
             checks.append(f"Max concurrent positions: {max_positions}")
         else:
             warnings.append("Max concurrent positions not specified (unlimited)")
         
-        # 2. Position size limits
-        max_position_pct = risk_mgmt.get('max_position_size_pct')
-        if max_position_pct is not None:
-            if max_position_pct <= 0 or max_position_pct > 100:
-                return HookResult(
-                    success=False,
-                    message=f"Invalid max_position_size_pct: {max_position_pct}% (must be 0-100)",
-                    priority="P0",
-                    should_halt=True
-                )
-            elif max_position_pct > 20:
-                warnings.append(f"High position size limit: {max_position_pct}% (>20% risky)")
-            
-            checks.append(f"Max position size: {max_position_pct}% of equity")
-        else:
-            warnings.append("Max position size not specified")
+        # 2-3. Position size and portfolio heat (total risk exposure) limits
+        failure = _apply_limit_checks(_RISK_LIMIT_CHECKS, risk_mgmt, checks, warnings)
+        if failure is not None:
+            return failure
         
-        # 3. Portfolio heat limits (total risk exposure)
-        max_heat_pct = risk_mgmt.get('max_portfolio_heat_pct')
-        if max_heat_pct is not None:
-            if max_heat_pct <= 0 or max_heat_pct > 100:
-                return HookResult(
-                    success=False,
-                    message=f"Invalid max_portfolio_heat_pct: {max_heat_pct}% (must be 0-100)",
-                    priority="P0",
-                    should_halt=True
-                )
-            elif max_heat_pct > 25:
-                warnings.append(f"High portfolio heat limit: {max_heat_pct}% (>25% very risky)")
-            
-            checks.append(f"Max portfolio heat: {max_heat_pct}%")
-            
-            # Validate consistency: portfolio heat should be >= max position size
-            if max_position_pct and max_heat_pct < max_position_pct:
-                return HookResult(
-                    success=False,
-                    message=f"Portfolio heat ({max_heat_pct}%) < max position size ({max_position_pct}%)",
-                    priority="P0",
-                    should_halt=True
-                )
-        else:
-            warnings.append("Max portfolio heat not specified")
+        max_position_pct = risk_mgmt['max_position_size_pct']
+        max_heat_pct = risk_mgmt['max_portfolio_heat_pct']
         
-        # 4. Leverage constraints
-        max_leverage = execution.get('max_leverage', 1.0)
-        if max_leverage < 1.0:
-            return HookResult(
-                success=False,
-                message=f"Invalid max_leverage: {max_leverage} (must be ≥ 1.0)",
-                priority="P0",
-                should_halt=True
-            )
-        elif max_leverage > 10.0:
-            warnings.append(f"High leverage: {max_leverage}x (>10x very risky)")
+        # Validate consistency: portfolio heat should be >= max position size
+        if max_heat_pct is not None and max_position_pct and max_heat_pct < max_position_pct:
+            return _halt(f"Portfolio heat ({max_heat_pct}%) < max position size ({max_position_pct}%)")
         
-        checks.append(f"Max leverage: {max_leverage}x")
+        # 4-5. Leverage and minimum notional constraints
+        failure = _apply_limit_checks(_EXECUTION_LIMIT_CHECKS, execution, checks, warnings)
+        if failure is not None:
+            return failure
         
-        # 5. Minimum notional constraints
-        min_notional = execution.get('min_notional')
-        if min_notional is not None:
-            if min_notional <= 0:
-                return HookResult(
-                    success=False,
-                    message=f"Invalid min_notional: {min_notional} (must be > 0)",
-                    priority="P0",
-                    should_halt=True
-                )
-            checks.append(f"Min notional: {min_notional}")
-        else:
-            warnings.append("Min notional not specified")
+        max_leverage = execution['max_leverage']
+        min_notional = execution['min_notional']
         
         # 6. Stop-loss/Take-profit method validation
-        sl_method = risk_mgmt.get('stop_loss_method')
-        tp_method = risk_mgmt.get('take_profit_method')
+        sl_method = risk_mgmt['stop_loss_method']
+        tp_method = risk_mgmt['take_profit_method']
         
         if not sl_method or sl_method == 'TBD':
             warnings.append("Stop-loss method not specified")
@@ -150,14 +140,15 @@ def execute(ctx: HookContext) -> HookResult:
             checks.append(f"Take-profit method: {tp_method}")
         
         # 7. Performance safety checks
-        estimated_memory = _estimate_memory_usage(ctx, config_data)
+        estimated_memory = _estimate_memory_usage(
+            universe_info.get('symbol_count', 10), date_range_days, config_data
+        )
         if estimated_memory > 8_000_000_000:  # 8GB
             warnings.append(f"High estimated memory usage: {estimated_memory / 1_000_000_000:.1f}GB")
         
         checks.append(f"Estimated memory: {estimated_memory / 1_000_000:.0f}MB")
         
         # 8. Time range sanity for performance
-        date_range_days = _calculate_date_range_days(ctx)
         if date_range_days > 1095:  # 3 years
             warnings.append(f"Long backtest period: {date_range_days} days (may be slow)")
         elif date_range_days < 30:
@@ -179,9 +170,8 @@ def execute(ctx: HookContext) -> HookResult:
         }
         
         # Write safety summary
-        safety_file = os.path.join(ctx.run_path, "safety_summary.json")
-        with open(safety_file, 'w') as f:
-            json.dump(safety_summary, f, indent=2)
+        safety_file = f"{run_path}{os.sep}safety_summary.json"
+        fast_json.write_file_atomic(safety_file, safety_summary, indent=True)
         
         # Write hook log
         log_data = {
@@ -197,8 +187,7 @@ def execute(ctx: HookContext) -> HookResult:
             "timestamp": ctx.timestamp.isoformat() if ctx.timestamp else None
         }
         
-        with open(ctx.hook_log_path, 'w') as f:
-            json.dump(log_data, f, indent=2)
+        fast_json.write_file(ctx.hook_log_path, log_data)
         
         message = f"Safety validation passed ({len(checks)} checks)"
         if warnings:
@@ -225,38 +214,70 @@ def execute(ctx: HookContext) -> HookResult:
         )
 
 
+def _halt(message: str) -> HookResult:
+    """Blocking failure result for an invalid safety parameter"""
+    return HookResult(
+        success=False,
+        message=message,
+        priority="P0",
+        should_halt=True
+    )
+
+
+def _apply_limit_checks(limit_checks: tuple, section: Dict[str, Any],
+                        checks: List[str], warnings: List[str]) -> Optional[HookResult]:
+    """Run a table of range checks against a config section; returns a halt result or None"""
+    for key, is_invalid, invalid_msg, warn_above, warn_msg, check_msg, missing_msg in limit_checks:
+        value = section[key]
+        if value is None and missing_msg is not None:
+            warnings.append(missing_msg)
+            continue
+        
+        if is_invalid(value):
+            return _halt(invalid_msg.format(value))
+        if warn_above is not None and value > warn_above:
+            warnings.append(warn_msg.format(value))
+        
+        checks.append(check_msg.format(value))
+    
+    return None
+
+
 def _load_backtest_config(ctx: HookContext) -> Dict[str, Any]:
     """Load backtest configuration from various possible sources"""
     
-    # Try to load from run-specific config
-    config_paths = [
-        os.path.join(ctx.run_path, "config.json"),
-        os.path.join("configs", f"{ctx.run_id}.json"),
-        os.path.join("configs", "base_config.json"),
-        os.path.join("configs", "default_config.json")
-    ]
-    
-    for config_path in config_paths:
-        if os.path.exists(config_path):
-            try:
-                with open(config_path, 'r') as f:
-                    return json.load(f)
-            except Exception:
-                continue
+    # Candidates are tried in priority order on every call, so a
+    # run-specific config created later takes over from a shared fallback.
+    # Parsed configs are cached across invocations until the file changes;
+    # callers only read from them
+    for config_path in _config_candidates(ctx.run_path, ctx.run_id):
+        try:
+            return fast_json.load_file_cached(config_path)
+        except Exception:
+            continue
     
     return {}
 
 
+@functools.lru_cache(maxsize=128)
+def _config_candidates(run_path: str, run_id: str) -> tuple:
+    """Config paths for a run, from run-specific to shared fallbacks"""
+    return (
+        f"{run_path}{os.sep}config.json",
+        f"configs{os.sep}{run_id}.json",
+        _BASE_CONFIG,
+        _DEFAULT_CONFIG
+    )
+
+
 def _get_universe_info(ctx: HookContext) -> Dict[str, Any]:
     """Get universe information from resolved universe file or context"""
     
-    universe_file = os.path.join(ctx.run_path, "resolved_universe.json")
-    if os.path.exists(universe_file):
-        try:
-            with open(universe_file, 'r') as f:
-                return json.load(f)
-        except Exception:
-            pass
+    universe_file = f"{ctx.run_path}{os.sep}resolved_universe.json"
+    try:
+        return fast_json.load_file_cached(universe_file)
+    except Exception:
+        pass
     
     # Fallback: parse from context
     if ctx.universe and ':' in ctx.universe:
@@ -267,13 +288,9 @@ def _get_universe_info(ctx: HookContext) -> Dict[str, Any]:
     return {"symbol_count": 0}
 
 
-def _estimate_memory_usage(ctx: HookContext, config: Dict[str, Any]) -> int:
+def _estimate_memory_usage(symbol_count: int, date_range_days: int, config: Dict[str, Any]) -> int:
     """Estimate memory usage for the backtest"""
     
-    universe_info = _get_universe_info(ctx)
-    symbol_count = universe_info.get('symbol_count', 10)
-    date_range_days = _calculate_date_range_days(ctx)
-    
     # Rough estimates (bytes)
     base_overhead = 100_000_000  # 100MB base
     per_symbol_per_day = 1000    # 1KB per symbol per day (OHLCV + features)
@@ -291,14 +308,23 @@ def _calculate_date_range_days(ctx: HookContext) -> int:
         return 0
     
     try:
-        from datetime import datetime
-        start_date = datetime.strptime(ctx.date_start, '%Y-%m-%d')
-        end_date = datetime.strptime(ctx.date_end, '%Y-%m-%d')
-        return (end_date - start_date).days
+        return _date_range_days(ctx.date_start, ctx.date_end)
     except ValueError:
         return 0
 
 
+@functools.lru_cache(maxsize=128)
+def _date_range_days(date_start: str, date_end: str) -> int:
+    """Days between two YYYY-MM-DD dates, memoized per pair"""
+    try:
+        return (date.fromisoformat(date_end) - date.fromisoformat(date_start)).days
+    except ValueError:
+        # Unpadded forms such as 2024-1-5 are not ISO but strptime accepts them
+        start_date = datetime.strptime(date_start, '%Y-%m-%d')
+        end_date = datetime.strptime(date_end, '%Y-%m-%d')
+        return (end_date - start_date).days
+
+
 if __name__ == "__main__":
     # Test hook
     test_ctx = HookContext(
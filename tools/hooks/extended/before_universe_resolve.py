@@ -6,10 +6,21 @@ Validate universe source and format before resolution
 
 import os
 import re
-import json
-from pathlib import Path
-from typing import List, Set, Dict, Any
+from typing import List, Dict, Any, FrozenSet, Optional, Tuple
 from ..lib.hook_context import HookContext, HookResult
+from ..lib import fast_json
+
+# Binance symbol pattern: base currency + quote currency (e.g., BTCUSDT, ETHBTC)
+_BINANCE_SYMBOL_RE = re.compile(r'^[A-Z0-9]{2,10}[A-Z]{3,6}$')  # 2-10 chars base + 3-6 chars quote
+_BINANCE_QUOTES = ('USDT', 'BTC', 'ETH', 'BNB', 'BUSD', 'USDC', 'USD', 'EUR')
+
+# Config and data locations, relative to the project root
+_BLACKLIST_FILE = os.path.join("configs", "symbol_blacklist.json")
+_WHITELIST_FILE = os.path.join("configs", "symbol_whitelist.json")
+_UNIVERSE_DIR = os.path.join("data", "universe")
+
+# Blacklist/whitelist path -> (parsed document, frozenset built from it)
+_FILTER_SETS: Dict[str, Tuple[Any, FrozenSet[str]]] = {}
 
 
 def execute(ctx: HookContext) -> HookResult:
@@ -62,10 +73,11 @@ def execute(ctx: HookContext) -> HookResult:
             
             checks.append(f"Binance symbols: {len(symbols)} validated")
             
-            # Check for duplicates
-            unique_symbols = list(set(symbols))
-            if len(unique_symbols) != len(symbols):
-                warnings.append(f"Duplicate symbols removed: {len(symbols) - len(unique_symbols)}")
+            # Check for duplicates (first occurrence wins, order preserved)
+            unique_symbols = list(dict.fromkeys(symbols))
+            duplicates_removed = len(symbols) - len(unique_symbols)
+            if duplicates_removed:
+                warnings.append(f"Duplicate symbols removed: {duplicates_removed}")
                 symbols = unique_symbols
                 
             validated_symbols = symbols
@@ -74,7 +86,7 @@ def execute(ctx: HookContext) -> HookResult:
             # File-based universe
             file_path = source_data
             if not os.path.isabs(file_path):
-                file_path = os.path.join("data", "universe", file_path)
+                file_path = f"{_UNIVERSE_DIR}{os.sep}{file_path}"
             
             if not os.path.exists(file_path):
                 return HookResult(
@@ -85,23 +97,27 @@ def execute(ctx: HookContext) -> HookResult:
                 )
             
             try:
-                with open(file_path, 'r') as f:
-                    if file_path.endswith('.json'):
-                        data = json.load(f)
-                        if isinstance(data, list):
-                            validated_symbols = data
-                        elif isinstance(data, dict) and 'symbols' in data:
-                            validated_symbols = data['symbols']
-                        else:
-                            return HookResult(
-                                success=False,
-                                message=f"Invalid JSON format in {file_path}",
-                                priority="P0",
-                                should_halt=True
-                            )
+                if file_path.endswith('.json'):
+                    # Single read, or an mmap for large universes
+                    data = fast_json.load_file(file_path)
+                    if isinstance(data, list):
+                        validated_symbols = list(dict.fromkeys(data))
+                    elif isinstance(data, dict) and 'symbols' in data:
+                        validated_symbols = list(dict.fromkeys(data['symbols']))
                     else:
-                        # Text file, one symbol per line
-                        validated_symbols = [line.strip().upper() for line in f if line.strip()]
+                        return HookResult(
+                            success=False,
+                            message=f"Invalid JSON format in {file_path}",
+                            priority="P0",
+                            should_halt=True
+                        )
+                else:
+                    # Text file, one symbol per line, streamed straight
+                    # into an order-preserving de-duplication
+                    with open(file_path, 'r') as f:
+                        validated_symbols = list(dict.fromkeys(
+                            symbol for symbol in (line.strip().upper() for line in f) if symbol
+                        ))
                 
                 checks.append(f"File universe: {len(validated_symbols)} symbols from {file_path}")
                 
@@ -161,11 +177,10 @@ def execute(ctx: HookContext) -> HookResult:
             "warnings": warnings
         }
         
-        universe_file = os.path.join(ctx.run_path, "resolved_universe.json")
-        os.makedirs(os.path.dirname(universe_file), exist_ok=True)
-        
-        with open(universe_file, 'w') as f:
-            json.dump(resolved_universe, f, indent=2)
+        # run_path already exists (ensure_hook_dir). Replaced atomically since
+        # later hooks read and cache this file.
+        universe_file = f"{ctx.run_path}{os.sep}resolved_universe.json"
+        fast_json.write_file_atomic(universe_file, resolved_universe, indent=True)
         
         # Write hook log
         log_data = {
@@ -179,8 +194,7 @@ def execute(ctx: HookContext) -> HookResult:
             "timestamp": ctx.timestamp.isoformat() if ctx.timestamp else None
         }
         
-        with open(ctx.hook_log_path, 'w') as f:
-            json.dump(log_data, f, indent=2)
+        fast_json.write_file(ctx.hook_log_path, log_data)
         
         message = f"Universe validated: {final_symbol_count} symbols"
         if warnings:
@@ -212,23 +226,21 @@ def _validate_binance_symbols(symbols: List[str]) -> Dict[str, Any]:
     """Validate Binance symbol format"""
     valid_symbols = []
     invalid_symbols = []
-    
-    # Binance symbol pattern: base currency + quote currency (e.g., BTCUSDT, ETHBTC)
-    symbol_pattern = re.compile(r'^[A-Z0-9]{2,10}[A-Z]{3,6}$')  # 2-10 chars base + 3-6 chars quote
-    
-    common_quotes = {'USDT', 'BTC', 'ETH', 'BNB', 'BUSD', 'USDC', 'USD', 'EUR'}
+    symbol_match = _BINANCE_SYMBOL_RE.match
     
     for symbol in symbols:
-        if symbol_pattern.match(symbol):
-            # Additional check: does it end with a known quote currency?
-            has_valid_quote = any(symbol.endswith(quote) for quote in common_quotes)
-            
-            if has_valid_quote:
-                valid_symbols.append(symbol)
-            else:
-                invalid_symbols.append(f"{symbol} (unknown quote currency)")
-        else:
+        # Cheap known-quote suffix test first. A 5-13 char [A-Z0-9] symbol
+        # ending in a known (all-letter) quote always matches the pattern, so
+        # the regex only runs for the remaining candidates.
+        if symbol.endswith(_BINANCE_QUOTES) and (
+            (5 <= len(symbol) <= 13 and symbol.isascii() and symbol.isalnum() and symbol.isupper())
+            or symbol_match(symbol)
+        ):
+            valid_symbols.append(symbol)
+        elif not symbol_match(symbol):
             invalid_symbols.append(f"{symbol} (invalid format)")
+        else:
+            invalid_symbols.append(f"{symbol} (unknown quote currency)")
     
     return {
         "valid": len(invalid_symbols) == 0,
@@ -237,56 +249,57 @@ def _validate_binance_symbols(symbols: List[str]) -> Dict[str, Any]:
     }
 
 
-def _apply_symbol_filters(symbols: List[str]) -> tuple[List[str], Dict[str, Any]]:
-    """Apply blacklist and whitelist filters to symbols"""
+def _load_symbol_filter(filter_file: str) -> Optional[FrozenSet[str]]:
+    """
+    Load a blacklist/whitelist file as a frozenset of symbols
     
-    # Load filters from config (if available)
-    blacklist_file = os.path.join("configs", "symbol_blacklist.json")
-    whitelist_file = os.path.join("configs", "symbol_whitelist.json")
+    Accepts a JSON list or an object with a 'symbols' list; returns None if
+    the file is missing or malformed. The set is cached alongside the parsed
+    document it was built from, so it is only rebuilt when the file changes.
+    """
+    try:
+        filter_data = fast_json.load_file_cached(filter_file)
+    except Exception:
+        return None
     
-    blacklist = set()
-    whitelist = None
+    cached = _FILTER_SETS.get(filter_file)
+    if cached is not None and cached[0] is filter_data:
+        return cached[1]
     
-    # Load blacklist
-    if os.path.exists(blacklist_file):
-        try:
-            with open(blacklist_file, 'r') as f:
-                blacklist_data = json.load(f)
-                if isinstance(blacklist_data, list):
-                    blacklist = set(blacklist_data)
-                elif isinstance(blacklist_data, dict) and 'symbols' in blacklist_data:
-                    blacklist = set(blacklist_data['symbols'])
-        except Exception:
-            pass
+    if isinstance(filter_data, list):
+        symbols = filter_data
+    elif isinstance(filter_data, dict) and 'symbols' in filter_data:
+        symbols = filter_data['symbols']
+    else:
+        return None
     
-    # Load whitelist
-    if os.path.exists(whitelist_file):
-        try:
-            with open(whitelist_file, 'r') as f:
-                whitelist_data = json.load(f)
-                if isinstance(whitelist_data, list):
-                    whitelist = set(whitelist_data)
-                elif isinstance(whitelist_data, dict) and 'symbols' in whitelist_data:
-                    whitelist = set(whitelist_data['symbols'])
-        except Exception:
-            pass
+    try:
+        symbol_set = frozenset(symbols)
+    except TypeError:
+        return None
     
-    # Apply filters
+    _FILTER_SETS[filter_file] = (filter_data, symbol_set)
+    return symbol_set
+
+
+def _apply_symbol_filters(symbols: List[str]) -> tuple[List[str], Dict[str, Any]]:
+    """Apply blacklist and whitelist filters to symbols"""
+    
+    # Load filters from config (if available)
+    blacklist = _load_symbol_filter(_BLACKLIST_FILE) or frozenset()
+    whitelist = _load_symbol_filter(_WHITELIST_FILE)
+    
+    # Apply filters: blacklist first (counting every removed entry), then the
+    # whitelist if one exists
     original_count = len(symbols)
-    filtered_symbols = []
-    blacklisted_count = 0
+    if blacklist:
+        filtered_symbols = [symbol for symbol in symbols if symbol not in blacklist]
+    else:
+        filtered_symbols = list(symbols)
+    blacklisted_count = original_count - len(filtered_symbols)
     
-    for symbol in symbols:
-        # Apply blacklist
-        if symbol in blacklist:
-            blacklisted_count += 1
-            continue
-        
-        # Apply whitelist (if exists)
-        if whitelist is not None and symbol not in whitelist:
-            continue
-        
-        filtered_symbols.append(symbol)
+    if whitelist is not None:
+        filtered_symbols = [symbol for symbol in filtered_symbols if symbol in whitelist]
     
     stats = {
         "original_count": original_count,
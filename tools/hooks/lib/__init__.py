@@ -0,0 +1,3 @@
+"""
+Hook library - shared infrastructure for hook modules
+"""
@@ -0,0 +1,157 @@
+"""
+Fast JSON helpers for hooks
+
+Uses orjson when it is installed and falls back to the stdlib json module
+otherwise. Files are read in one shot in binary mode and parsed from bytes,
+which avoids the incremental text-mode reads done by json.load().
+"""
+
+import os
+import json
+import mmap
+from typing import Any, Dict, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+# catching the stdlib exception type regardless of the active backend.
+JSONDecodeError = json.JSONDecodeError
+
+# Files above this size are parsed from an mmap (orjson only; the stdlib
+# parser cannot read from a buffer without copying it first)
+_MMAP_MIN_BYTES = 256 * 1024
+
+# orjson options for every dump: numpy scalars/arrays and non-str dict keys
+# are accepted, as the stdlib encoder (with _default) accepts them
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# Parsed documents for load_file_cached(): path -> (st_mtime_ns, st_size, obj)
+_FILE_CACHE: Dict[str, Tuple[int, int, Any]] = {}
+
+
+def loads(data: bytes) -> Any:
+    """Parse JSON from bytes (or str)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _default(obj: Any) -> Any:
+    """Convert numpy scalars and arrays (anything with tolist()) for the encoder"""
+    tolist = getattr(obj, 'tolist', None)
+    if tolist is None:
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+    return tolist()
+
+
+def _dumps_stdlib(obj: Any, indent: bool) -> str:
+    """Serialize obj with the stdlib encoder, in the same layout as orjson"""
+    if indent:
+        return json.dumps(obj, indent=2, default=_default)
+    return json.dumps(obj, separators=(',', ':'), default=_default)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON bytes, optionally pretty-printed
+    
+    Accepts numpy scalars and arrays and non-str dict keys with either
+    backend. Documents orjson rejects (e.g. integers wider than 64 bits) are
+    serialized with the stdlib encoder instead.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                obj, default=_default,
+                option=(_ORJSON_OPTIONS | orjson.OPT_INDENT_2) if indent else _ORJSON_OPTIONS
+            )
+        except orjson.JSONEncodeError:
+            pass
+    return _dumps_stdlib(obj, indent).encode()
+
+
+def dumps_line(obj: Any) -> bytes:
+    """Serialize obj as one compact JSON Lines record, newline included"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            pass
+    return (_dumps_stdlib(obj, False) + '\n').encode()
+
+
+def load_file(path: str) -> Any:
+    """
+    Read a JSON file with a single unbuffered read and parse it
+    
+    Large files are parsed straight from a read-only mmap when orjson is
+    available, so the document is never copied into a bytes object.
+    """
+    with open(path, 'rb', buffering=0) as f:
+        if ORJSON_AVAILABLE and os.fstat(f.fileno()).st_size > _MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        return loads(f.read())
+
+
+def load_file_cached(path: str) -> Any:
+    """
+    Like load_file(), but memoized until the file's mtime or size changes
+    
+    The parsed object is shared between callers and must not be mutated.
+    Raises FileNotFoundError if path does not exist.
+    """
+    key = os.fspath(path)
+    st = os.stat(key)
+    cached = _FILE_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    
+    obj = load_file(key)
+    _FILE_CACHE[key] = (st.st_mtime_ns, st.st_size, obj)
+    return obj
+
+
+def write_file(path: str, obj: Any, indent: bool = False) -> None:
+    """
+    Serialize obj and write it to path with a single write
+    
+    obj is serialized before the file is opened, so a serialization error
+    leaves any existing file untouched.
+    """
+    data = dumps(obj, indent=indent)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def write_file_atomic(path: str, obj: Any, indent: bool = False) -> None:
+    """
+    Write obj to path via a temporary file and os.replace()
+    
+    Concurrent readers see either the previous or the new document, never a
+    truncated one. No fsync is issued; callers use this for observability
+    files rather than as a durability boundary. The payload goes straight to
+    the descriptor with os.write(), bypassing file-object buffering.
+    """
+    data = memoryview(dumps(obj, indent=indent))
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
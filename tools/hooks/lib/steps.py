@@ -0,0 +1,33 @@
+"""
+Hook step runner
+
+Several hooks perform a sequence of independent best-effort actions and record
+one progress message per action. Each action is a step function that returns
+(ok, message) instead of raising for expected failures, so a hook can declare
+its sequence once at import time as a tuple of steps and execute it with
+run_steps() without try/except scaffolding around every step.
+"""
+
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+from .hook_context import HookContext
+
+# step(ctx, state) -> (ok, message)
+HookStep = Callable[[HookContext, Dict[str, Any]], Tuple[bool, str]]
+
+
+def run_steps(steps: Sequence[HookStep], ctx: HookContext,
+              state: Dict[str, Any], actions: List[str]) -> bool:
+    """
+    Run each step in order and append its message to actions
+
+    Steps may share values computed earlier in the sequence through state.
+    Steps report their own expected failures as (False, message) and the
+    remaining steps still run; an unexpected exception propagates to the hook.
+    Returns True if every step reported success.
+    """
+    all_ok = True
+    for step in steps:
+        ok, message = step(ctx, state)
+        actions.append(message)
+        all_ok = all_ok and ok
+    return all_ok
@@ -5,11 +5,46 @@ Critical safety hook - halt on accounting identity violations
 """
 
 import os
-import json
+import sys
+import atexit
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, Optional, Tuple
 from ..lib.hook_context import HookContext, HookResult
 from ..lib.anomaly_logger import log_anomaly
+from ..lib import fast_json
+
+# Global violations registry, appended to through one O_APPEND descriptor
+# kept open for the life of the process
+_VIOLATIONS_LOG = os.path.join("docs", "runs", "accounting_violations.jsonl")
+_violations_fd: Optional[int] = None
+
+# Audit findings and fix recommendations; identical for every violation
+_ACCOUNTING_CHECK = {
+    "identity_check": "FAILED",
+    "possible_causes": (
+        "Fee calculation error",
+        "Position tracking bug",
+        "Realized PnL calculation error",
+        "Cash balance tracking issue",
+        "Order execution accounting bug"
+    ),
+    "requires_investigation": True
+}
+_ACCOUNTING_FIXES = (
+    "1. HALT all trading operations immediately",
+    "2. Audit fee calculation logic",
+    "3. Verify position tracking accuracy",
+    "4. Check realized PnL calculations",
+    "5. Review cash balance updates",
+    "6. Add accounting identity unit tests",
+    "7. Implement continuous accounting validation"
+)
+
+# Fixed parts of the console alert
+_BANNER = "=" * 80
+_ALERT_HEADER = f"\n{_BANNER}\n🚨 CRITICAL ALERT: ACCOUNTING MISMATCH DETECTED 🚨\n{_BANNER}\n"
+_ALERT_VERDICT = "⚠️  ACCOUNTING IDENTITY VIOLATED - BACKTEST INVALID\n"
+_ALERT_FOOTER = f"{_BANNER}\n\n"
 
 
 def execute(ctx: HookContext, mismatch_data: Dict[str, Any] = None) -> HookResult:
@@ -57,30 +92,31 @@ def execute(ctx: HookContext, mismatch_data: Dict[str, Any] = None) -> HookResul
             "recommended_fixes": _get_accounting_fixes(mismatch_data)
         }
         
-        # Write to violation files
-        violation_file = os.path.join(ctx.run_path, "ACCOUNTING_VIOLATION.json")
-        with open(violation_file, 'w') as f:
-            json.dump(violation_report, f, indent=2)
+        # Write to violation files. Both payloads are serialized (numpy
+        # values included) before any file is opened, so a serialization
+        # error cannot leave a truncated report behind.
+        violation_file = f"{ctx.run_path}{os.sep}ACCOUNTING_VIOLATION.json"
+        violation_payload = fast_json.dumps(violation_report, indent=True)
+        registry_line = fast_json.dumps_line(violation_report)
         
-        # Global registry
-        registry_file = os.path.join("docs", "runs", "accounting_violations.jsonl")
-        os.makedirs(os.path.dirname(registry_file), exist_ok=True)
+        with open(violation_file, 'wb') as f:
+            f.write(violation_payload)
         
-        with open(registry_file, 'a') as f:
-            f.write(json.dumps(violation_report) + '\n')
+        # Global registry (one write per line, atomic under O_APPEND)
+        os.write(_get_violations_fd(), registry_line)
         
-        # Console alert
-        print("\n" + "="*80)
-        print("🚨 CRITICAL ALERT: ACCOUNTING MISMATCH DETECTED 🚨")
-        print("="*80)
-        print(f"Run ID: {ctx.run_id}")
-        print(f"Expected Equity: {mismatch_data.get('expected_equity')}")
-        print(f"Actual Equity: {mismatch_data.get('actual_equity')}")
-        print(f"Difference: {mismatch_data.get('difference')}")
-        print(f"Severity: {severity}")
-        print("⚠️  ACCOUNTING IDENTITY VIOLATED - BACKTEST INVALID")
-        print(f"📋 Report: {violation_file}")
-        print("="*80 + "\n")
+        # Console alert, written in one go
+        sys.stdout.write(
+            f"{_ALERT_HEADER}"
+            f"Run ID: {ctx.run_id}\n"
+            f"Expected Equity: {mismatch_data.get('expected_equity')}\n"
+            f"Actual Equity: {mismatch_data.get('actual_equity')}\n"
+            f"Difference: {mismatch_data.get('difference')}\n"
+            f"Severity: {severity}\n"
+            f"{_ALERT_VERDICT}"
+            f"📋 Report: {violation_file}\n"
+            f"{_ALERT_FOOTER}"
+        )
         
         return HookResult(
             success=False,
@@ -99,6 +135,22 @@ def execute(ctx: HookContext, mismatch_data: Dict[str, Any] = None) -> HookResul
         )
 
 
+def _get_violations_fd() -> int:
+    """Open the violations registry for appending on first use"""
+    global _violations_fd
+    
+    if _violations_fd is None:
+        os.makedirs(os.path.dirname(_VIOLATIONS_LOG), exist_ok=True)
+        _violations_fd = os.open(
+            _VIOLATIONS_LOG,
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_CLOEXEC,
+            0o644
+        )
+        atexit.register(os.close, _violations_fd)
+    
+    return _violations_fd
+
+
 def _assess_accounting_severity(mismatch_data: Dict[str, Any]) -> str:
     """Determine severity of accounting mismatch"""
     
@@ -117,31 +169,14 @@ def _assess_accounting_severity(mismatch_data: Dict[str, Any]) -> str:
 def _perform_detailed_accounting_check(ctx: HookContext, mismatch_data: Dict[str, Any]) -> Dict[str, Any]:
     """Perform detailed accounting audit"""
     
-    return {
-        "identity_check": "FAILED",
-        "possible_causes": [
-            "Fee calculation error",
-            "Position tracking bug",
-            "Realized PnL calculation error",
-            "Cash balance tracking issue",
-            "Order execution accounting bug"
-        ],
-        "requires_investigation": True
-    }
+    # Shallow copy: the report is handed back to callers in HookResult.details
+    return dict(_ACCOUNTING_CHECK)
 
 
-def _get_accounting_fixes(mismatch_data: Dict[str, Any]) -> List[str]:
+def _get_accounting_fixes(mismatch_data: Dict[str, Any]) -> Tuple[str, ...]:
     """Generate specific fix recommendations"""
     
-    return [
-        "1. HALT all trading operations immediately",
-        "2. Audit fee calculation logic",
-        "3. Verify position tracking accuracy",
-        "4. Check realized PnL calculations",
-        "5. Review cash balance updates",
-        "6. Add accounting identity unit tests",
-        "7. Implement continuous accounting validation"
-    ]
+    return _ACCOUNTING_FIXES
 
 
 if __name__ == "__main__":
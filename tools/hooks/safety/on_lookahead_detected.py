@@ -5,11 +5,81 @@ Critical safety hook - immediately halt pipeline on lookahead violations
 """
 
 import os
+import sys
 import json
+import atexit
 from datetime import datetime
 from typing import Dict, Any, List
 from ..lib.hook_context import HookContext, HookResult
 from ..lib.anomaly_logger import log_anomaly
+from ..lib import fast_json
+
+# Global JSON Lines logs, each appended to through one O_APPEND descriptor
+# kept open for the life of the process
+_VIOLATION_REGISTRY = os.path.join("docs", "runs", "lookahead_violations.jsonl")
+_ALERT_LOG = os.path.join("docs", "runs", "critical_alerts.jsonl")
+_append_fds: Dict[str, int] = {}
+
+# Impact by violation type, matched as substrings in this order
+_IMPACT_LEVELS = {
+    'future_price_access': 'SEVERE - Results completely unrealistic',
+    'signal_timing': 'HIGH - Entry/exit timing compromised', 
+    'feature_calculation': 'HIGH - Feature integrity compromised',
+    'data_leakage': 'SEVERE - Information from future leaked',
+    'execution_timing': 'MEDIUM - Execution assumptions violated',
+    'unknown': 'HIGH - Unknown scope requires investigation'
+}
+
+# Remediation steps: always the base steps, then those for each matching
+# violation type
+_BASE_REMEDIATION_STEPS = (
+    "1. IMMEDIATELY HALT pipeline execution",
+    "2. Review and fix the code/logic causing lookahead",
+    "3. Add unit tests to prevent similar violations",
+    "4. Rerun backtest after fixes are implemented",
+    "5. Verify no other lookahead violations exist"
+)
+_SPECIFIC_REMEDIATION_STEPS = (
+    ('future_price', (
+        "• Audit all price data access patterns",
+        "• Ensure features only use data t and earlier",
+        "• Check for shifted/forward-looking data alignment"
+    )),
+    ('signal_timing', (
+        "• Review signal generation timing logic",
+        "• Ensure signals generate at time t for action at t+1",
+        "• Audit order execution timing assumptions"
+    )),
+    ('feature_calculation', (
+        "• Audit feature calculation windows",
+        "• Check for rolling window edge cases",
+        "• Verify feature availability timing"
+    )),
+)
+
+# Stand in for impact and remediation when the hook runs with fast_halt,
+# keeping the shapes of the full assessment
+_DEFERRED_ASSESSMENT = "DEFERRED (fast_halt) - recompute from the registry entry"
+_DEFERRED_IMPACT = {
+    "impact_level": "DEFERRED",
+    "reliability_compromised": True,
+    "results_validity": "INVALID",
+    "recommended_action": "HALT_AND_FIX",
+    "rerun_required": True,
+    "confidence_in_results": 0.0,
+    "note": _DEFERRED_ASSESSMENT
+}
+
+# Fixed parts of the console alert
+_BANNER = "=" * 80
+_RULE = "-" * 80
+_ALERT_HEADER = f"\n{_BANNER}\n🚨 CRITICAL ALERT: LOOKAHEAD VIOLATION DETECTED 🚨\n{_BANNER}\n"
+_ALERT_VERDICT = (
+    f"{_RULE}\n"
+    "⚠️  PIPELINE HALTED - BACKTEST RESULTS ARE INVALID\n"
+    "⚠️  DO NOT PROCEED UNTIL VIOLATION IS FIXED\n"
+)
+_ALERT_FOOTER = f"{_BANNER}\n\n"
 
 
 def execute(ctx: HookContext, evidence: Dict[str, Any] = None) -> HookResult:
@@ -24,6 +94,7 @@ def execute(ctx: HookContext, evidence: Dict[str, Any] = None) -> HookResult:
     """
     
     ctx.ensure_hook_dir()
+    now_iso = datetime.utcnow().isoformat()
     
     try:
         # Default evidence if not provided
@@ -32,14 +103,14 @@ def execute(ctx: HookContext, evidence: Dict[str, Any] = None) -> HookResult:
                 "violation_type": "unknown",
                 "location": "not specified",
                 "description": "Lookahead violation detected",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso
             }
         
         # Ensure required fields exist
         evidence.setdefault('violation_type', 'unknown')
         evidence.setdefault('location', 'not specified')
         evidence.setdefault('description', 'Lookahead violation detected')
-        evidence.setdefault('timestamp', datetime.utcnow().isoformat())
+        evidence.setdefault('timestamp', now_iso)
         evidence.setdefault('severity', 'critical')
         
         # Log to anomaly registry
@@ -52,7 +123,16 @@ def execute(ctx: HookContext, evidence: Dict[str, Any] = None) -> HookResult:
             path_hint=evidence.get('location')
         )
         
-        # Generate detailed violation report
+        # Generate detailed violation report. With ctx.fast_halt set (e.g. a
+        # fail-fast CI run) impact and remediation are not assessed; both
+        # can be recomputed later from the evidence in the registry entry.
+        if getattr(ctx, 'fast_halt', False):
+            impact_assessment = dict(_DEFERRED_IMPACT)
+            recommended_actions = [_DEFERRED_ASSESSMENT]
+        else:
+            impact_assessment = _assess_lookahead_impact(evidence)
+            recommended_actions = _get_lookahead_remediation_steps(evidence)
+        
         violation_report = {
             "run_id": ctx.run_id,
             "phase": ctx.phase,
@@ -61,72 +141,67 @@ def execute(ctx: HookContext, evidence: Dict[str, Any] = None) -> HookResult:
             "universe": ctx.universe,
             "date_range": f"{ctx.date_start} to {ctx.date_end}",
             "evidence": evidence,
-            "impact_assessment": _assess_lookahead_impact(evidence),
-            "recommended_actions": _get_lookahead_remediation_steps(evidence)
+            "impact_assessment": impact_assessment,
+            "recommended_actions": recommended_actions
         }
         
-        # Write violation to multiple locations for visibility
+        # Write violation to multiple locations for visibility. Every payload
+        # is serialized before anything is written, then each destination
+        # gets a single write.
         
         # 1. Run-specific violation file
         violation_file = os.path.join(ctx.run_path, "LOOKAHEAD_VIOLATION.json")
-        with open(violation_file, 'w') as f:
-            json.dump(violation_report, f, indent=2)
+        violation_payload = fast_json.dumps(violation_report, indent=True)
         
         # 2. Global violation registry
-        violation_registry = os.path.join("docs", "runs", "lookahead_violations.jsonl")
-        os.makedirs(os.path.dirname(violation_registry), exist_ok=True)
-        
-        registry_entry = {
-            **violation_report,
-            "logged_at": datetime.utcnow().isoformat()
-        }
-        
-        with open(violation_registry, 'a') as f:
-            f.write(json.dumps(registry_entry) + '\n')
+        # (the run file above is already serialized, so the report itself
+        # can take the logged_at stamp instead of being copied)
+        violation_registry = _VIOLATION_REGISTRY
+        violation_report["logged_at"] = now_iso
+        registry_line = fast_json.dumps_line(violation_report)
         
         # 3. Critical alerts log
-        alert_log = os.path.join("docs", "runs", "critical_alerts.jsonl")
+        alert_log = _ALERT_LOG
         alert_entry = {
             "alert_type": "LOOKAHEAD_VIOLATION",
             "run_id": ctx.run_id,
             "severity": "CRITICAL",
             "message": f"Lookahead violation detected: {evidence.get('description')}",
             "evidence_location": violation_file,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso,
             "requires_immediate_attention": True
         }
+        alert_line = fast_json.dumps_line(alert_entry)
         
-        with open(alert_log, 'a') as f:
-            f.write(json.dumps(alert_entry) + '\n')
+        _write_bytes(violation_file, violation_payload)
+        os.write(_get_append_fd(violation_registry), registry_line)
+        os.write(_get_append_fd(alert_log), alert_line)
         
-        # 4. Console alert (immediate visibility)
-        print("\n" + "="*80)
-        print("🚨 CRITICAL ALERT: LOOKAHEAD VIOLATION DETECTED 🚨")
-        print("="*80)
-        print(f"Run ID: {ctx.run_id}")
-        print(f"Phase: {ctx.phase}")
-        print(f"Violation Type: {evidence.get('violation_type')}")
-        print(f"Location: {evidence.get('location')}")
-        print(f"Description: {evidence.get('description')}")
-        print(f"Detection Time: {evidence.get('timestamp')}")
-        print("-" * 80)
-        print("⚠️  PIPELINE HALTED - BACKTEST RESULTS ARE INVALID")
-        print("⚠️  DO NOT PROCEED UNTIL VIOLATION IS FIXED")
-        print(f"📋 Detailed report: {violation_file}")
-        print("="*80 + "\n")
+        # 4. Console alert (immediate visibility), written in one go
+        sys.stdout.write(
+            f"{_ALERT_HEADER}"
+            f"Run ID: {ctx.run_id}\n"
+            f"Phase: {ctx.phase}\n"
+            f"Violation Type: {evidence.get('violation_type')}\n"
+            f"Location: {evidence.get('location')}\n"
+            f"Description: {evidence.get('description')}\n"
+            f"Detection Time: {evidence.get('timestamp')}\n"
+            f"{_ALERT_VERDICT}"
+            f"📋 Detailed report: {violation_file}\n"
+            f"{_ALERT_FOOTER}"
+        )
         
         # 5. Mark run as invalid
         run_status = {
             "status": "INVALID_LOOKAHEAD",
-            "marked_at": datetime.utcnow().isoformat(),
+            "marked_at": now_iso,
             "violation_evidence": evidence,
             "can_proceed": False,
             "requires_fix": True
         }
         
         status_file = os.path.join(ctx.run_path, "run_status.json")
-        with open(status_file, 'w') as f:
-            json.dump(run_status, f, indent=2)
+        fast_json.write_file(status_file, run_status, indent=True)
         
         # Write hook log
         log_data = {
@@ -145,8 +220,7 @@ def execute(ctx: HookContext, evidence: Dict[str, Any] = None) -> HookResult:
             "timestamp": ctx.timestamp.isoformat() if ctx.timestamp else None
         }
         
-        with open(ctx.hook_log_path, 'w') as f:
-            json.dump(log_data, f, indent=2)
+        fast_json.write_file(ctx.hook_log_path, log_data, indent=True)
         
         # Return critical failure
         return HookResult(
@@ -171,14 +245,15 @@ def execute(ctx: HookContext, evidence: Dict[str, Any] = None) -> HookResult:
             "run_id": ctx.run_id,
             "original_evidence": evidence,
             "hook_error": str(e),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now_iso
         }
         
+        # Serialized with the stdlib encoder and default=str, so whatever in
+        # the evidence broke the main path cannot break the emergency record
         try:
             emergency_file = os.path.join(ctx.run_path, "EMERGENCY_LOOKAHEAD_ALERT.json")
-            with open(emergency_file, 'w') as f:
-                json.dump(emergency_log, f, indent=2)
-        except:
+            _write_bytes(emergency_file, json.dumps(emergency_log, indent=2, default=str).encode())
+        except Exception:
             pass
         
         return HookResult(
@@ -195,20 +270,16 @@ def _assess_lookahead_impact(evidence: Dict[str, Any]) -> Dict[str, Any]:
     
     violation_type = evidence.get('violation_type', '').lower()
     
-    impact_levels = {
-        'future_price_access': 'SEVERE - Results completely unrealistic',
-        'signal_timing': 'HIGH - Entry/exit timing compromised', 
-        'feature_calculation': 'HIGH - Feature integrity compromised',
-        'data_leakage': 'SEVERE - Information from future leaked',
-        'execution_timing': 'MEDIUM - Execution assumptions violated',
-        'unknown': 'HIGH - Unknown scope requires investigation'
-    }
-    
-    impact_level = 'HIGH'
-    for violation_key, level in impact_levels.items():
-        if violation_key in violation_type:
-            impact_level = level
-            break
+    # Exact type first; the substring scan only runs for compound or
+    # unrecognised types (no key is a substring of another, so an exact
+    # match is also what the scan would find)
+    impact_level = _IMPACT_LEVELS.get(violation_type)
+    if impact_level is None:
+        impact_level = 'HIGH'
+        for violation_key, level in _IMPACT_LEVELS.items():
+            if violation_key in violation_type:
+                impact_level = level
+                break
     
     return {
         "impact_level": impact_level,
@@ -226,41 +297,35 @@ def _get_lookahead_remediation_steps(evidence: Dict[str, Any]) -> List[str]:
     violation_type = evidence.get('violation_type', '').lower()
     location = evidence.get('location', '')
     
-    base_steps = [
-        "1. IMMEDIATELY HALT pipeline execution",
-        "2. Review and fix the code/logic causing lookahead",
-        "3. Add unit tests to prevent similar violations",
-        "4. Rerun backtest after fixes are implemented",
-        "5. Verify no other lookahead violations exist"
-    ]
-    
-    specific_steps = []
+    steps = list(_BASE_REMEDIATION_STEPS)
     
-    if 'future_price' in violation_type:
-        specific_steps.extend([
-            "• Audit all price data access patterns",
-            "• Ensure features only use data t and earlier",
-            "• Check for shifted/forward-looking data alignment"
-        ])
+    for violation_key, specific_steps in _SPECIFIC_REMEDIATION_STEPS:
+        if violation_key in violation_type:
+            steps.extend(specific_steps)
     
-    if 'signal_timing' in violation_type:
-        specific_steps.extend([
-            "• Review signal generation timing logic",
-            "• Ensure signals generate at time t for action at t+1",
-            "• Audit order execution timing assumptions"
-        ])
+    if location:
+        steps.append(f"• Focus investigation on: {location}")
     
-    if 'feature_calculation' in violation_type:
-        specific_steps.extend([
-            "• Audit feature calculation windows",
-            "• Check for rolling window edge cases",
-            "• Verify feature availability timing"
-        ])
+    return steps
+
+
+def _get_append_fd(path: str) -> int:
+    """Open a JSON Lines log for appending on first use"""
+    fd = _append_fds.get(path)
     
-    if location:
-        specific_steps.append(f"• Focus investigation on: {location}")
+    if fd is None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_CLOEXEC, 0o644)
+        atexit.register(os.close, fd)
+        _append_fds[path] = fd
     
-    return base_steps + specific_steps
+    return fd
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Replace the contents of path with an already-serialized payload"""
+    with open(path, 'wb') as f:
+        f.write(data)
 
 
 if __name__ == "__main__":
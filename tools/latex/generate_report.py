@@ -7,9 +7,11 @@ It takes analysis artifacts and renders them into a LaTeX document, then compile
 
 Usage:
     python tools/latex/generate_report.py --run-id <run_id> [--output <output.pdf>]
+    python tools/latex/generate_report.py --run-ids <run_a>,<run_b>,...
 """
 
 import argparse
+import functools
 import json
 import sys
 import subprocess
@@ -21,10 +23,22 @@ from typing import Dict, Any, List, Optional
 import tempfile
 import re
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class LaTeXReportGenerator:
     """Generates professional PDF reports from trading strategy evaluation results."""
     
+    # {{key}} placeholders in the LaTeX templates
+    _PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+    
+    # One row of the parameter table: name, value, description
+    _PARAMETER_ROW = "{} & {} & Strategy parameter \\\\"
+    
     def __init__(self, run_id: str, run_data_path: str = "data/runs"):
         self.run_id = run_id
         self.run_path = Path(run_data_path) / run_id
@@ -43,8 +57,12 @@ class LaTeXReportGenerator:
         if not file_path.exists():
             raise FileNotFoundError(f"Required file not found: {file_path}")
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        # Read in one go and parse the bytes (orjson when installed)
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        if ORJSON_AVAILABLE:
+            return orjson.loads(data)
+        return json.loads(data)
     
     def _validate_inputs(self):
         """Validate that all required inputs are available."""
@@ -56,21 +74,30 @@ class LaTeXReportGenerator:
             "series.csv"
         ]
         
-        missing_files = []
-        for file in required_files:
-            if not (self.run_path / file).exists():
-                missing_files.append(file)
+        # One directory listing instead of a stat per file
+        try:
+            with os.scandir(self.run_path) as entries:
+                present = {entry.name for entry in entries}
+        except FileNotFoundError:
+            present = set()
+        
+        missing_files = [file for file in required_files if file not in present]
         
         if missing_files:
             raise FileNotFoundError(f"Missing required files: {missing_files}")
         
         # Check for figures directory
-        figs_path = self.run_path / "figs"
-        if not figs_path.exists():
+        if "figs" not in present:
+            figs_path = self.run_path / "figs"
             raise FileNotFoundError(f"Figures directory not found: {figs_path}")
     
-    def generate_report(self, output_path: str = None) -> str:
-        """Generate the complete PDF report."""
+    def generate_report(self, output_path: str = None, work_dir: Optional[str] = None) -> str:
+        """
+        Generate the complete PDF report.
+        
+        work_dir is an existing build directory to compile in, shared between
+        reports in batch mode; a temporary one is used when it is None.
+        """
         
         if output_path is None:
             output_path = f"docs/notices/SER/{self.run_id}_strategy_report.pdf"
@@ -84,7 +111,7 @@ class LaTeXReportGenerator:
         latex_content = self._render_template(template_data)
         
         # Compile to PDF
-        pdf_path = self._compile_latex(latex_content, output_path)
+        pdf_path = self._compile_latex(latex_content, output_path, work_dir)
         
         print(f"Report generated successfully: {pdf_path}")
         return pdf_path
@@ -92,11 +119,14 @@ class LaTeXReportGenerator:
     def _prepare_template_data(self) -> Dict[str, str]:
         """Prepare all data for template substitution."""
         
+        # One clock reading for every date in the report
+        now = datetime.now()
+        
         # Basic metadata
         data = {
             'strategy_name': self.manifest.get('strategy_name', 'Trading Strategy'),
             'author': 'Trading Strategy Framework',
-            'generation_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'generation_date': now.strftime('%Y-%m-%d %H:%M:%S'),
             'run_id': self.run_id,
             'config_hash': self.manifest.get('config_hash', 'N/A'),
             'engine_version': self.manifest.get('engine_version', 'N/A'),
@@ -119,7 +149,7 @@ class LaTeXReportGenerator:
         data.update(self._prepare_chart_paths())
         
         # Analysis text (will be filled by evaluator)
-        data.update(self._prepare_analysis_sections())
+        data.update(self._prepare_analysis_sections(now))
         
         return data
     
@@ -162,22 +192,28 @@ class LaTeXReportGenerator:
             'symbol_chart_2_path': 'symbol_2.png',
         }
         
+        # One directory scan; names in scan order, as glob("*.png") lists them
+        try:
+            with os.scandir(figs_path) as entries:
+                png_names = [
+                    entry.name for entry in entries
+                    if entry.name.endswith('.png') and not entry.name.startswith('.')
+                ]
+        except FileNotFoundError:
+            png_names = []
+        
+        figs_dir = figs_path.absolute()
+        available = set(png_names)
+        # Fallback to first available chart
+        fallback = str(figs_dir / png_names[0]) if png_names else "chart_not_found.png"
+        
         chart_paths = {}
         for key, filename in chart_files.items():
-            chart_path = figs_path / filename
-            if chart_path.exists():
-                chart_paths[key] = str(chart_path.absolute())
-            else:
-                # Fallback to first available chart
-                available_charts = list(figs_path.glob("*.png"))
-                if available_charts:
-                    chart_paths[key] = str(available_charts[0].absolute())
-                else:
-                    chart_paths[key] = "chart_not_found.png"
+            chart_paths[key] = str(figs_dir / filename) if filename in available else fallback
         
         return chart_paths
     
-    def _prepare_analysis_sections(self) -> Dict[str, str]:
+    def _prepare_analysis_sections(self, now: datetime) -> Dict[str, str]:
         """Prepare analysis text sections (to be filled by evaluator)."""
         
         # These are placeholders that should be filled by the evaluator
@@ -214,7 +250,7 @@ class LaTeXReportGenerator:
             'implementation_considerations': 'Implementation considerations to be provided by evaluator.',
             'next_steps_recommendations': 'Next steps to be provided by evaluator.',
             'data_source': self.manifest.get('data_source', 'N/A'),
-            'analysis_date': datetime.now().strftime('%Y-%m-%d'),
+            'analysis_date': now.strftime('%Y-%m-%d'),
             'methodology_notes': 'Methodology notes and assumptions.',
             'var_95': 'TBD',
             'expected_shortfall': 'TBD',
@@ -231,9 +267,13 @@ class LaTeXReportGenerator:
             return "No parameters available & & \\\\"
         
         rows = []
+        rows_append = rows.append
+        row_template = self._PARAMETER_ROW
         for param_name, param_value in parameters.items():
-            param_name_display = param_name.replace('_', '\\_')
-            rows.append(f"{param_name_display} & {param_value} & Strategy parameter \\\\")
+            # Escape underscores for LaTeX; names without one are used as-is
+            if '_' in param_name:
+                param_name = param_name.replace('_', '\\_')
+            rows_append(row_template.format(param_name, param_value))
         
         return '\n'.join(rows)
     
@@ -243,70 +283,110 @@ class LaTeXReportGenerator:
         if not self.template_path.exists():
             raise FileNotFoundError(f"LaTeX template not found: {self.template_path}")
         
-        with open(self.template_path, 'r', encoding='utf-8') as f:
-            template_content = f.read()
+        template_content = self._read_template(str(self.template_path))
         
-        # Simple template substitution using {{key}} format
-        for key, value in data.items():
-            placeholder = f"{{{{{key}}}}}"
-            template_content = template_content.replace(placeholder, str(value))
+        # Substitute {{key}} placeholders in a single pass; unknown keys are
+        # left in place
+        def substitute(match):
+            key = match.group(1)
+            return str(data[key]) if key in data else match.group(0)
         
-        return template_content
+        return self._PLACEHOLDER_RE.sub(substitute, template_content)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _read_template(template_path: str) -> str:
+        """Read a LaTeX template, once per process for each path."""
+        with open(template_path, 'r', encoding='utf-8') as f:
+            return f.read()
     
-    def _compile_latex(self, latex_content: str, output_path: str) -> str:
+    def _compile_latex(self, latex_content: str, output_path: str,
+                       work_dir: Optional[str] = None) -> str:
         """Compile LaTeX content to PDF."""
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_dir_path = Path(temp_dir)
+        if work_dir is None:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                return self._compile_latex(latex_content, output_path, temp_dir)
+        
+        temp_dir_path = Path(work_dir)
+        
+        # Stage the figures first: pdflatex reads images (for their
+        # dimensions) during the first pass
+        self._stage_figures(temp_dir_path)
+        
+        # Write LaTeX file: encoded once, written straight to the descriptor
+        tex_file = temp_dir_path / "report.tex"
+        data = memoryview(latex_content.encode('utf-8'))
+        fd = os.open(tex_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        
+        try:
+            self._run_latex(temp_dir_path)
             
-            # Write LaTeX file
-            tex_file = temp_dir_path / "report.tex"
-            with open(tex_file, 'w', encoding='utf-8') as f:
-                f.write(latex_content)
+            # Copy PDF to output location
+            pdf_source = temp_dir_path / "report.pdf"
+            output_path = Path(output_path).resolve()
+            shutil.copy2(pdf_source, output_path)
             
-            # Copy figure files to temp directory
-            figs_source = self.run_path / "figs"
-            if figs_source.exists():
-                figs_dest = temp_dir_path / "figs"
-                shutil.copytree(figs_source, figs_dest)
+            return str(output_path)
             
-            # Compile with pdflatex
-            try:
-                # First pass
-                subprocess.run(
-                    ['pdflatex', '-interaction=nonstopmode', 'report.tex'],
-                    cwd=temp_dir_path,
-                    check=True,
-                    capture_output=True,
-                    text=True
-                )
-                
-                # Second pass for references
-                subprocess.run(
-                    ['pdflatex', '-interaction=nonstopmode', 'report.tex'],
-                    cwd=temp_dir_path,
-                    check=True,
-                    capture_output=True,
-                    text=True
-                )
-                
-                # Copy PDF to output location
-                pdf_source = temp_dir_path / "report.pdf"
-                output_path = Path(output_path).resolve()
-                shutil.copy2(pdf_source, output_path)
-                
-                return str(output_path)
-                
-            except subprocess.CalledProcessError as e:
-                # Read log file for error details
-                log_file = temp_dir_path / "report.log"
-                if log_file.exists():
-                    with open(log_file, 'r', encoding='utf-8') as f:
-                        log_content = f.read()
-                    print("LaTeX compilation error:")
-                    print(log_content[-2000:])  # Show last 2000 chars
-                
-                raise Exception(f"LaTeX compilation failed: {e}")
+        except subprocess.CalledProcessError as e:
+            # Read log file for error details
+            log_file = temp_dir_path / "report.log"
+            if log_file.exists():
+                with open(log_file, 'r', encoding='utf-8') as f:
+                    log_content = f.read()
+                print("LaTeX compilation error:")
+                print(log_content[-2000:])  # Show last 2000 chars
+            
+            raise Exception(f"LaTeX compilation failed: {e}")
+    
+    def _stage_figures(self, work_dir: Path) -> None:
+        """
+        Hard-link the run's figures into work_dir/figs (copied instead where
+        linking is not possible), replacing any left by the previous report
+        in a shared build directory.
+        """
+        figs_source = self.run_path / "figs"
+        figs_dest = work_dir / "figs"
+        if figs_dest.exists():
+            shutil.rmtree(figs_dest)
+        if figs_source.exists():
+            shutil.copytree(figs_source, figs_dest, copy_function=_link_or_copy)
+    
+    def _run_latex(self, work_dir: Path) -> None:
+        """Compile report.tex in work_dir, raising CalledProcessError on failure."""
+        
+        # Console output is discarded; on failure the diagnostics come from
+        # report.log. latexmk reruns pdflatex only while the .aux changes, so
+        # documents without moving references take a single pass.
+        if self.check_latexmk_availability():
+            subprocess.run(
+                ['latexmk', '-pdf', '-interaction=nonstopmode', '-halt-on-error', 'report.tex'],
+                cwd=work_dir,
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+            return
+        
+        # Without latexmk: two pdflatex passes, the second for references
+        for _ in range(2):
+            subprocess.run(
+                ['pdflatex', '-interaction=nonstopmode', 'report.tex'],
+                cwd=work_dir,
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+    
+    def check_latexmk_availability(self) -> bool:
+        """Check if latexmk is available on the system."""
+        return shutil.which('latexmk') is not None
     
     def check_latex_availability(self) -> bool:
         """Check if LaTeX is available on the system."""
@@ -321,15 +401,28 @@ class LaTeXReportGenerator:
             return False
 
 
+def _link_or_copy(src: str, dst: str) -> str:
+    """Hard-link src to dst, falling back to a copy (e.g. across devices)."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
 def main():
     """Main entry point for report generation."""
     
     parser = argparse.ArgumentParser(description='Generate professional PDF report from trading strategy analysis')
-    parser.add_argument(
+    run_selection = parser.add_mutually_exclusive_group(required=True)
+    run_selection.add_argument(
         '--run-id',
-        required=True,
         help='Run ID for the strategy analysis'
     )
+    run_selection.add_argument(
+        '--run-ids',
+        help='Comma-separated run IDs to report on in one process (batch mode, default output paths)'
+    )
     parser.add_argument(
         '--output',
         help='Output PDF path (default: <run_id>_strategy_report.pdf)'
@@ -347,6 +440,9 @@ def main():
     
     args = parser.parse_args()
     
+    if args.run_ids and args.output:
+        parser.error('--output cannot be combined with --run-ids')
+    
     if args.check_latex:
         generator = LaTeXReportGenerator("dummy", args.run_data_path)
         if generator.check_latex_availability():
@@ -356,6 +452,10 @@ def main():
             print("LaTeX is not available. Please install LaTeX (e.g., TeX Live, MiKTeX)")
             sys.exit(1)
     
+    if args.run_ids:
+        sys.exit(_generate_batch([r.strip() for r in args.run_ids.split(',') if r.strip()],
+                                 args.run_data_path))
+    
     try:
         # Generate report
         generator = LaTeXReportGenerator(args.run_id, args.run_data_path)
@@ -376,5 +476,41 @@ def main():
         sys.exit(1)
 
 
+def _generate_batch(run_ids: List[str], run_data_path: str) -> int:
+    """
+    Generate reports for several runs in one process.
+    
+    The interpreter, the template cache and a single build directory are
+    shared across runs. A failing run is reported and skipped; returns the
+    process exit code (1 if any report failed).
+    """
+    failed = []
+    latex_checked = False
+    
+    with tempfile.TemporaryDirectory() as work_dir:
+        for run_id in run_ids:
+            try:
+                generator = LaTeXReportGenerator(run_id, run_data_path)
+                
+                # Check LaTeX availability once for the batch
+                if not latex_checked:
+                    if not generator.check_latex_availability():
+                        print("Warning: LaTeX not available. Please install LaTeX for PDF generation.")
+                        print("Recommended: TeX Live (Linux/Mac) or MiKTeX (Windows)")
+                        return 1
+                    latex_checked = True
+                
+                generator.generate_report(work_dir=work_dir)
+            except Exception as e:
+                print(f"Error generating report for {run_id}: {e}")
+                failed.append(run_id)
+    
+    print(f"Batch report generation finished: {len(run_ids) - len(failed)}/{len(run_ids)} succeeded")
+    if failed:
+        print(f"Failed runs: {', '.join(failed)}")
+        return 1
+    return 0
+
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
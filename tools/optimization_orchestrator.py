@@ -4,26 +4,282 @@ Optimization Orchestrator
 Coordinates parameter optimization with existing analyzer/evaluator workflow
 """
 
+import csv
+import functools
+import io
 import json
 import os
+import re
 import hashlib
+import struct
+import itertools
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, Iterator, List, Any, Optional, Sequence
 import subprocess
-import itertools
-import random
 import numpy as np
+import pandas as pd
+from collections import Counter
 from dataclasses import dataclass, asdict
 import logging
+import logging.handlers
+import multiprocessing
+import threading
+import atexit
+import weakref
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 import yaml
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from walkforward_validator import WalkForwardValidator, ValidationWindow, ParameterCombination
 from overfitting_detector import OverfittingDetector
 
+# "key: value" lines of the markdown config, optionally as a "- " list item
+# and/or with the key in bold
+_CONFIG_LINE_RE = re.compile(r'^[ \t]*(?:- )?\**(\w+)\**:[ \t]+(.+?)[ \t]*$', re.MULTILINE)
+_NUMBER_RE = re.compile(r'-?(?:\d+\.?\d*|\.\d+)')
+_RANGE_SUFFIXES = ('_min', '_max', '_step')
+
+# libyaml-backed loader when PyYAML was built with it. The base loader
+# leaves every scalar a string (no YAML 1.1 implicit typing of yes/no, 1:30,
+# dates, ...), so values are typed by _parse_config_value on either path.
+_YAML_LOADER = getattr(yaml, 'CBaseLoader', yaml.BaseLoader)
+
+# Status values written through immediately instead of waiting for the
+# debounce interval
+_TERMINAL_STATUSES = frozenset({'completed', 'failed'})
+
+# Orchestrators with a study status not yet written, flushed at exit. Weak,
+# so a finished orchestrator is not kept alive until the interpreter exits.
+_pending_status_orchestrators: 'weakref.WeakSet[OptimizationOrchestrator]' = weakref.WeakSet()
+
+# Rows of parameter values converted from numpy to Python scalars at a time
+_ROW_CHUNK = 4096
+
+# Orchestrator log format, and handlers shared by every orchestrator logger
+# in the process: one console handler and one file handler per log file
+_LOG_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers: Dict[str, logging.Handler] = {}
+
+def _parse_config_date(value: str) -> datetime:
+    """Parse a YYYY-MM-DD config date"""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        # Unpadded forms such as 2024-1-5 are not ISO but strptime accepts them
+        return datetime.strptime(value, '%Y-%m-%d')
+
+
+def _range_values(min_val: Any, max_val: Any, step: Any, is_int: bool) -> np.ndarray:
+    """
+    Values min, min + step, ... up to max (inclusive) of a parameter range
+    
+    int64 for integer ranges, float64 otherwise. Float values are computed as
+    min + i * step rather than accumulated, and the count tolerates rounding
+    in (max - min) / step, so max itself is neither dropped nor overshot.
+    """
+    if is_int:
+        return np.arange(min_val, max_val + 1, step, dtype=np.int64)
+    n_values = int(np.floor((max_val - min_val) / step + 1e-9)) + 1
+    return min_val + step * np.arange(n_values, dtype=np.float64)
+
+
+def _iter_value_rows(columns: List[np.ndarray], n_rows: int) -> Iterator[tuple]:
+    """
+    Yield rows of parallel value columns as tuples of Python scalars
+    
+    Columns are converted with tolist() one chunk of rows at a time, so a
+    large sweep never holds every value as a Python object at once.
+    """
+    if not columns:
+        yield from itertools.repeat((), n_rows)
+        return
+    
+    for start in range(0, n_rows, _ROW_CHUNK):
+        yield from zip(*[column[start:start + _ROW_CHUNK].tolist() for column in columns])
+
+
+def _csv_cell(value: Any) -> Any:
+    """Spell a NaN float 'nan', as csv.writer does; other values pass through"""
+    if isinstance(value, (float, np.floating)) and np.isnan(value):
+        return 'nan'
+    return value
+
+
+def _shared_log_handlers(log_file: Path) -> List[logging.Handler]:
+    """Console and file handlers for log_file, created on first use"""
+    handlers = []
+    for key in ('console', os.path.abspath(log_file)):
+        handler = _log_handlers.get(key)
+        if handler is None:
+            handler = logging.StreamHandler() if key == 'console' else logging.FileHandler(key)
+            handler.setLevel(logging.INFO)
+            handler.setFormatter(_LOG_FORMATTER)
+            _log_handlers[key] = handler
+        handlers.append(handler)
+    return handlers
+
+
+def _make_parameter_hasher(
+    parameter_ranges: Dict[str, Dict[str, Any]],
+    fixed_params: Dict[str, Any]
+) -> Callable[[Sequence[Any]], str]:
+    """
+    Build the parameter_hash function for one sweep
+    
+    The returned function takes the optimized parameter values in
+    parameter_ranges order. Key order and the fixed parameters are the same
+    for every combination of a sweep, so they are hashed once into a base
+    blake2b state. Each combination only packs its numeric values (int64 for
+    integer ranges, double otherwise) in sorted key order and hashes those.
+    """
+    param_names = list(parameter_ranges)
+    order = sorted(range(len(param_names)), key=param_names.__getitem__)
+    formats = []
+    for i in order:
+        formats.append('q' if parameter_ranges[param_names[i]]['is_int'] else 'd')
+    packer = struct.Struct('<' + ''.join(formats))
+    
+    base = hashlib.blake2b(digest_size=4)
+    base.update(repr((sorted(param_names), sorted(fixed_params.items()))).encode())
+    
+    def parameter_hash(values: Sequence[Any]) -> str:
+        h = base.copy()
+        h.update(packer.pack(*[values[i] for i in order]))
+        return h.hexdigest()
+    
+    return parameter_hash
+
+
+def _write_json(path: Path, obj: Any) -> None:
+    """
+    Write obj to path as indented JSON
+    
+    orjson, when installed, serializes numpy scalars and arrays natively;
+    default=str only catches any other non-JSON type.
+    """
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            default=str
+        ))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2, default=str)
+
+
+def _load_yaml_config(content: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse a config that is plain YAML: a flat mapping of scalar values
+    
+    Values are typed exactly as the markdown parser types them. Returns None
+    for anything else (markdown prose, bold keys, [REQUIRED] placeholders),
+    which is left to the markdown parser.
+    """
+    try:
+        data = yaml.load(content, Loader=_YAML_LOADER)
+    except yaml.YAMLError:
+        return None
+    
+    if not isinstance(data, dict):
+        return None
+    
+    config = {}
+    for key, value in data.items():
+        if not isinstance(value, str):
+            return None
+        if value:
+            config[key] = _parse_config_value(value)
+    return config
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse an optimization config file
+    
+    mtime_ns and size only key the cache, so an edited file is parsed again.
+    Callers must copy the result before modifying it.
+    """
+    with open(path, 'r') as f:
+        content = f.read()
+    
+    # Plain YAML configs go through the YAML loader; markdown configs fall
+    # back to extracting key-value pairs in a single pass
+    config = _load_yaml_config(content)
+    if config is None:
+        config = {}
+        for match in _CONFIG_LINE_RE.finditer(content):
+            key, value = match.groups()
+            if '[REQUIRED' in value:
+                continue  # Skip template lines
+            config[key] = _parse_config_value(value)
+    
+    return config
+
+
+def _parse_config_value(value: str) -> Any:
+    """Convert a markdown config value to bool, int, float or str"""
+    lowered = value.lower()
+    if lowered in ('true', 'false'):
+        return lowered == 'true'
+    if _NUMBER_RE.fullmatch(value):
+        return float(value) if '.' in value else int(value)
+    return value
+
+
+# Per-process validator, validation windows and study seed used by parameter
+# sweep workers
+_worker_validator: Optional[WalkForwardValidator] = None
+_worker_windows: List[ValidationWindow] = []
+_worker_seed: Optional[int] = None
+
+
+def _init_sweep_worker(
+    config: Dict[str, Any],
+    validation_windows: List[ValidationWindow],
+    log_queue
+) -> None:
+    """
+    Set up a parameter sweep worker process
+    
+    Validator log records are forwarded to the parent through log_queue. The
+    validator and the validation windows are set up once per worker rather
+    than shipped with every task.
+    """
+    global _worker_validator, _worker_windows, _worker_seed
+    
+    validator_logger = logging.getLogger('walkforward_validator')
+    validator_logger.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    validator_logger.propagate = False
+    
+    _worker_validator = WalkForwardValidator(config)
+    _worker_windows = validation_windows
+    _worker_seed = config.get('random_seed')
+
+
+def _validate_in_worker(combination: ParameterCombination, index: int):
+    """
+    Validate one parameter combination in a sweep worker process
+    
+    With random_seed configured, the global numpy RNG (which the validator
+    draws from) is seeded from the seed and the combination's position in
+    the sweep, so results do not depend on which worker runs which task.
+    """
+    if _worker_seed is not None:
+        np.random.seed([_worker_seed, index])
+    return _worker_validator.validate_parameter_combination(combination, _worker_windows)
+
+
 @dataclass
 class OptimizationStudy:
     """Represents a complete optimization study"""
@@ -49,15 +305,18 @@ class OptimizationOrchestrator:
     6. Integration with evaluator for final assessment
     """
     
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: str, flush_interval_ms: int = 250):
         """
         Initialize orchestrator with optimization configuration
         
         Args:
             config_path: Path to optimization_config.md file
+            flush_interval_ms: Window over which study status updates are
+                coalesced into a single write of study_status.json
         """
         self.config_path = Path(config_path)
         self.config = self._load_optimization_config()
+        self._fixed_params: Optional[Dict[str, Any]] = None
         self.study_id = self._generate_study_id()
         self.logger = self._setup_logging()
         
@@ -74,44 +333,24 @@ class OptimizationOrchestrator:
         self.completed_combinations = 0
         self.failed_combinations = 0
         
+        # Debounced study status: the latest update waits for the timer
+        self._status_flush_interval = flush_interval_ms / 1000
+        self._status_lock = threading.Lock()
+        self._pending_status: Optional[Dict[str, Any]] = None
+        self._status_timer: Optional[threading.Timer] = None
+        
     def _load_optimization_config(self) -> Dict[str, Any]:
         """Load and validate optimization configuration"""
         
-        if not self.config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
+        try:
+            stat = self.config_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {self.config_path}") from None
         
-        # Parse markdown configuration file
-        config = {}
-        with open(self.config_path, 'r') as f:
-            content = f.read()
-            
-        # Extract configuration parameters from markdown
-        # This is a simplified parser - in production you might use a more robust approach
-        lines = content.split('\n')
-        for line in lines:
-            if ':' in line and not line.strip().startswith('#'):
-                # Remove markdown formatting and extract key-value pairs
-                clean_line = line.strip()
-                if clean_line.startswith('- '):
-                    clean_line = clean_line[2:]
-                
-                if ': [REQUIRED:' in clean_line:
-                    continue  # Skip template lines
-                    
-                if ': ' in clean_line and not '[REQUIRED' in clean_line:
-                    key, value = clean_line.split(': ', 1)
-                    
-                    # Clean up key
-                    key = key.strip('*').strip()
-                    
-                    # Parse value
-                    value = value.strip()
-                    if value.lower() in ['true', 'false']:
-                        config[key] = value.lower() == 'true'
-                    elif value.replace('.', '').replace('-', '').isdigit():
-                        config[key] = float(value) if '.' in value else int(value)
-                    else:
-                        config[key] = value
+        # Parsed once per file version; each orchestrator gets its own copy
+        config = dict(_parse_config_file(
+            os.path.abspath(self.config_path), stat.st_mtime_ns, stat.st_size
+        ))
         
         # Validate required parameters
         required_params = [
@@ -135,29 +374,22 @@ class OptimizationOrchestrator:
         return f"{study_name}_{timestamp}_{unique_id}"
     
     def _setup_logging(self) -> logging.Logger:
-        """Setup logging for orchestrator"""
+        """
+        Setup logging for orchestrator
+        
+        Handlers and the formatter are shared across orchestrators, so creating
+        many studies in one process opens the log file once.
+        """
         logger = logging.getLogger(f'optimization_orchestrator_{self.study_id}')
+        if logger.handlers:
+            return logger
+        
         logger.setLevel(logging.INFO)
         
-        # File handler for study-specific log
+        # File handler for study-specific log, plus console handler
         log_file = self.study_dir / 'optimization.log' if hasattr(self, 'study_dir') else Path('optimization.log')
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(logging.INFO)
-        
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        
-        # Formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
-        
-        if not logger.handlers:
-            logger.addHandler(file_handler)
-            logger.addHandler(console_handler)
+        for handler in _shared_log_handlers(log_file):
+            logger.addHandler(handler)
         
         return logger
     
@@ -190,7 +422,7 @@ class OptimizationOrchestrator:
             
             # Phase 6: Generate study artifacts
             study_results = self._generate_study_artifacts(
-                parameter_combinations, validation_results, overfitting_assessments
+                validation_results, overfitting_assessments
             )
             
             # Phase 7: Update study registry
@@ -208,32 +440,18 @@ class OptimizationOrchestrator:
         """Validate optimization configuration completeness"""
         self.logger.info("Validating optimization configuration")
         
-        # Check parameter ranges are properly defined
-        required_ranges = []
-        
-        # Extract parameter range definitions
-        with open(self.config_path, 'r') as f:
-            content = f.read()
-        
-        # Look for parameter range patterns (simplified)
-        import re
-        param_patterns = [
-            r'(\w+)_min:', r'(\w+)_max:', r'(\w+)_step:'
-        ]
-        
-        for pattern in param_patterns:
-            matches = re.findall(pattern, content)
-            for match in matches:
-                param_base = match.replace('_min', '').replace('_max', '').replace('_step', '')
-                if param_base not in required_ranges:
-                    required_ranges.append(param_base)
+        # Check parameter ranges are properly defined (from the parsed
+        # <param>_min/_max/_step keys)
+        required_ranges = {
+            key.rsplit('_', 1)[0] for key in self.config if key.endswith(_RANGE_SUFFIXES)
+        }
         
         self.logger.info(f"Found {len(required_ranges)} parameter ranges to optimize")
         
         # Validate date range supports walk-forward analysis
         total_months = self.config['training_period_months'] + self.config['validation_period_months']
-        start_date = datetime.strptime(self.config['start_date'], '%Y-%m-%d')
-        end_date = datetime.strptime(self.config['end_date'], '%Y-%m-%d')
+        start_date = _parse_config_date(self.config['start_date'])
+        end_date = _parse_config_date(self.config['end_date'])
         available_months = (end_date - start_date).days / 30.44  # Average days per month
         
         if available_months < total_months * 2:  # Need at least 2 validation cycles
@@ -242,8 +460,13 @@ class OptimizationOrchestrator:
                 f"Need {total_months * 2:.1f} months, have {available_months:.1f} months"
             )
     
-    def _generate_parameter_combinations(self) -> List[ParameterCombination]:
-        """Generate parameter combinations based on search strategy"""
+    def _generate_parameter_combinations(self) -> Iterator[ParameterCombination]:
+        """
+        Generate parameter combinations based on search strategy
+        
+        Combinations are produced lazily as the sweep consumes them; the
+        count is known up front and stored in self.total_combinations.
+        """
         self.logger.info(f"Generating parameter combinations using {self.config['search_strategy']} search")
         
         # Extract parameter ranges from configuration
@@ -254,51 +477,53 @@ class OptimizationOrchestrator:
         
         if search_strategy == 'grid':
             combinations = self._generate_grid_combinations(parameter_ranges)
+            n_combinations = int(np.prod([len(r['values']) for r in parameter_ranges.values()]))
         elif search_strategy == 'random':
             combinations = self._generate_random_combinations(parameter_ranges, max_combinations)
+            n_combinations = max_combinations
         elif search_strategy == 'bayesian':
             combinations = self._generate_bayesian_combinations(parameter_ranges, max_combinations)
+            n_combinations = max_combinations
         else:
             raise ValueError(f"Unknown search strategy: {search_strategy}")
         
         # Limit to max combinations if needed
-        if len(combinations) > max_combinations:
+        if n_combinations > max_combinations:
             if search_strategy == 'grid':
                 # For grid search, warn about truncation
-                self.logger.warning(f"Grid search generated {len(combinations)} combinations, truncating to {max_combinations}")
-            combinations = combinations[:max_combinations]
+                self.logger.warning(f"Grid search generated {n_combinations} combinations, truncating to {max_combinations}")
+            combinations = itertools.islice(combinations, max_combinations)
+            n_combinations = max_combinations
         
-        self.total_combinations = len(combinations)
-        self.logger.info(f"Generated {len(combinations)} parameter combinations")
+        self.total_combinations = n_combinations
+        self.logger.info(f"Generated {n_combinations} parameter combinations")
         
         return combinations
     
     def _extract_parameter_ranges(self) -> Dict[str, Dict[str, Any]]:
-        """Extract parameter ranges from configuration"""
+        """
+        Extract parameter ranges from configuration
+        
+        Each complete range also gets 'is_int' (integer min and step) and
+        'values', the array of every value in the range, computed once here
+        for the generators to share.
+        """
         ranges = {}
         
-        # Parse configuration for parameter ranges
+        # Parse configuration for parameter ranges (<param>_min/_max/_step)
         for key, value in self.config.items():
-            if '_min' in key:
-                param_name = key.replace('_min', '')
-                if param_name not in ranges:
-                    ranges[param_name] = {}
-                ranges[param_name]['min'] = value
-            elif '_max' in key:
-                param_name = key.replace('_max', '')
-                if param_name not in ranges:
-                    ranges[param_name] = {}
-                ranges[param_name]['max'] = value
-            elif '_step' in key:
-                param_name = key.replace('_step', '')
-                if param_name not in ranges:
-                    ranges[param_name] = {}
-                ranges[param_name]['step'] = value
+            if key.endswith(_RANGE_SUFFIXES):
+                param_name, _, bound = key.rpartition('_')
+                ranges.setdefault(param_name, {})[bound] = value
         
         # Validate ranges are complete
         complete_ranges = {}
         for param, range_def in ranges.items():
             if 'min' in range_def and 'max' in range_def and 'step' in range_def:
+                range_def['is_int'] = isinstance(range_def['min'], int) and isinstance(range_def['step'], int)
+                range_def['values'] = _range_values(
+                    range_def['min'], range_def['max'], range_def['step'], range_def['is_int']
+                )
                 complete_ranges[param] = range_def
             else:
                 missing = [k for k in ['min', 'max', 'step'] if k not in range_def]
@@ -309,114 +534,95 @@ class OptimizationOrchestrator:
     def _generate_grid_combinations(
         self, 
         parameter_ranges: Dict[str, Dict[str, Any]]
-    ) -> List[ParameterCombination]:
+    ) -> Iterator[ParameterCombination]:
         """Generate all possible parameter combinations (grid search)"""
         
-        param_values = {}
-        for param, range_def in parameter_ranges.items():
-            min_val = range_def['min']
-            max_val = range_def['max']
-            step = range_def['step']
-            
-            # Generate value range
-            if isinstance(min_val, int) and isinstance(step, int):
-                values = list(range(min_val, max_val + 1, step))
-            else:
-                values = []
-                val = min_val
-                while val <= max_val:
-                    values.append(val)
-                    val += step
-            
-            param_values[param] = values
+        param_names = list(parameter_ranges.keys())
         
-        # Generate all combinations
-        combinations = []
-        param_names = list(param_values.keys())
+        # Each range is converted to Python scalars once; itertools.product
+        # then builds one row at a time, so truncation to max_combinations
+        # never materializes the rest of the grid
+        value_lists = [parameter_ranges[param]['values'].tolist() for param in param_names]
+        
+        # Add fixed parameters from configuration
+        fixed_params = self._get_fixed_parameters()
+        parameter_hash = _make_parameter_hasher(parameter_ranges, fixed_params)
         
-        for combination in itertools.product(*[param_values[p] for p in param_names]):
+        # Generate all combinations
+        for i, combination in enumerate(itertools.product(*value_lists)):
             params = dict(zip(param_names, combination))
-            
-            # Add fixed parameters from configuration
-            fixed_params = self._get_fixed_parameters()
             params.update(fixed_params)
             
             # Generate combination ID and hash
-            combo_id = f"grid_{len(combinations):04d}"
-            param_hash = hashlib.md5(str(sorted(params.items())).encode()).hexdigest()[:8]
+            combo_id = f"grid_{i:04d}"
+            param_hash = parameter_hash(combination)
             
-            combinations.append(ParameterCombination(
+            yield ParameterCombination(
                 combination_id=combo_id,
                 parameters=params,
                 parameter_hash=param_hash
-            ))
-        
-        return combinations
+            )
     
     def _generate_random_combinations(
         self,
         parameter_ranges: Dict[str, Dict[str, Any]],
         max_combinations: int
-    ) -> List[ParameterCombination]:
+    ) -> Iterator[ParameterCombination]:
         """Generate random parameter combinations"""
         
-        # Set random seed for reproducibility
-        if 'random_seed' in self.config:
-            random.seed(self.config['random_seed'])
-            np.random.seed(self.config['random_seed'])
+        # Seeded generator for reproducibility
+        rng = np.random.default_rng(self.config.get('random_seed'))
+        
+        # Draw every step index in one call (one column per parameter), then
+        # look each column up in the parameter's precomputed values
+        param_names = list(parameter_ranges.keys())
+        value_arrays = [parameter_ranges[param]['values'] for param in param_names]
+        step_indices = rng.integers(
+            0, [len(values) for values in value_arrays], size=(max_combinations, len(param_names))
+        )
+        
+        columns = [values[step_indices[:, j]] for j, values in enumerate(value_arrays)]
         
-        combinations = []
         fixed_params = self._get_fixed_parameters()
+        parameter_hash = _make_parameter_hasher(parameter_ranges, fixed_params)
         
-        for i in range(max_combinations):
-            params = {}
-            
-            # Generate random value for each parameter
-            for param, range_def in parameter_ranges.items():
-                min_val = range_def['min']
-                max_val = range_def['max']
-                step = range_def['step']
-                
-                if isinstance(min_val, int) and isinstance(step, int):
-                    # Integer parameter
-                    n_steps = int((max_val - min_val) / step) + 1
-                    step_idx = random.randint(0, n_steps - 1)
-                    value = min_val + step_idx * step
-                else:
-                    # Float parameter
-                    n_steps = int((max_val - min_val) / step) + 1
-                    step_idx = random.randint(0, n_steps - 1)
-                    value = min_val + step_idx * step
-                    
-                params[param] = value
+        for i, values in enumerate(_iter_value_rows(columns, max_combinations)):
+            params = dict(zip(param_names, values))
             
             # Add fixed parameters
             params.update(fixed_params)
             
             # Generate combination ID and hash
             combo_id = f"rand_{i:04d}"
-            param_hash = hashlib.md5(str(sorted(params.items())).encode()).hexdigest()[:8]
+            param_hash = parameter_hash(values)
             
-            combinations.append(ParameterCombination(
+            yield ParameterCombination(
                 combination_id=combo_id,
                 parameters=params,
                 parameter_hash=param_hash
-            ))
-        
-        return combinations
+            )
     
     def _generate_bayesian_combinations(
         self,
         parameter_ranges: Dict[str, Dict[str, Any]],
         max_combinations: int
-    ) -> List[ParameterCombination]:
+    ) -> Iterator[ParameterCombination]:
         """Generate parameter combinations using Bayesian optimization"""
         # Simplified implementation - in production you might use scikit-optimize
         self.logger.warning("Bayesian optimization not fully implemented, using random sampling")
         return self._generate_random_combinations(parameter_ranges, max_combinations)
     
     def _get_fixed_parameters(self) -> Dict[str, Any]:
-        """Get parameters that remain fixed during optimization"""
+        """
+        Get parameters that remain fixed during optimization
+        
+        The config does not change after loading, so the dict is built on
+        first use and shared by every later call; callers copy from it
+        (dict.update) and must not modify it.
+        """
+        if self._fixed_params is not None:
+            return self._fixed_params
+        
         fixed_params = {}
         
         # Portfolio parameters (typically fixed)
@@ -443,55 +649,105 @@ class OptimizationOrchestrator:
             if key in self.config:
                 fixed_params[key] = self.config[key]
         
+        self._fixed_params = fixed_params
         return fixed_params
     
     def _execute_parameter_sweep(
         self,
-        parameter_combinations: List[ParameterCombination],
+        parameter_combinations: Iterator[ParameterCombination],
         validation_windows: List[ValidationWindow]
     ) -> List[Any]:
         """Execute parameter sweep with walk-forward validation"""
         
-        self.logger.info(f"Executing parameter sweep with {len(parameter_combinations)} combinations")
+        self.logger.info(f"Executing parameter sweep with {self.total_combinations} combinations")
         
         # Setup progress tracking
         self.completed_combinations = 0
         self.failed_combinations = 0
         validation_results = []
         
-        # Determine parallel execution strategy
-        max_parallel = self.config.get('max_parallel_runs', 4)
-        
-        with ThreadPoolExecutor(max_workers=max_parallel) as executor:
-            # Submit all validation tasks
-            future_to_combination = {
-                executor.submit(
-                    self.validator.validate_parameter_combination,
-                    combination,
-                    validation_windows
-                ): combination
-                for combination in parameter_combinations
-            }
-            
-            # Process completed tasks
-            for future in as_completed(future_to_combination):
-                combination = future_to_combination[future]
+        # Determine parallel execution strategy: validations run in separate
+        # (spawned) processes so Python-level work is not serialized on the
+        # GIL. Worker log records are replayed through the parent's validator
+        # handlers. Unless max_parallel_runs is configured there is one
+        # worker per CPU, but never more workers than combinations since each
+        # spawned worker pays the interpreter and import start-up cost.
+        max_parallel = self.config.get('max_parallel_runs') or os.cpu_count() or 1
+        max_parallel = max(1, min(max_parallel, self.total_combinations))
+        mp_context = multiprocessing.get_context('spawn')
+        log_queue = mp_context.Queue()
+        log_listener = logging.handlers.QueueListener(
+            log_queue, *self.validator.logger.handlers, respect_handler_level=True
+        )
+        log_listener.start()
+        
+        try:
+            with ProcessPoolExecutor(
+                max_workers=max_parallel,
+                mp_context=mp_context,
+                initializer=_init_sweep_worker,
+                initargs=(self.config, validation_windows, log_queue)
+            ) as executor:
+                # Keep a bounded number of validation tasks in flight (enough to
+                # keep every worker busy) and submit the next one as each
+                # completes, so large sweeps are not queued up front
+                remaining = enumerate(parameter_combinations)
+                pending = {}
+                pool_broken = False
                 
-                try:
-                    result = future.result(timeout=self.config.get('timeout_minutes_per_run', 15) * 60)
-                    validation_results.append(result)
-                    self.completed_combinations += 1
-                    
-                    # Log progress
-                    progress_pct = (self.completed_combinations / self.total_combinations) * 100
-                    self.logger.info(
-                        f"Completed {combination.combination_id} "
-                        f"({self.completed_combinations}/{self.total_combinations}, {progress_pct:.1f}%)"
-                    )
+                def submit_next() -> None:
+                    nonlocal pool_broken, remaining
+                    if pool_broken:
+                        return
+                    entry = next(remaining, None)
+                    if entry is None:
+                        return
+                    index, combination = entry
+                    try:
+                        pending[executor.submit(_validate_in_worker, combination, index)] = combination
+                    except BrokenProcessPool:
+                        # A worker died (out of memory, crash, failed import) and
+                        # the pool accepts no more work. Tasks already in flight
+                        # fail with the same error; the rest are not dispatched.
+                        pool_broken = True
+                        remaining = itertools.chain([entry], remaining)
+                
+                for _ in range(max_parallel * 2):
+                    submit_next()
+                
+                # Process completed tasks
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
                     
-                except Exception as e:
-                    self.failed_combinations += 1
-                    self.logger.error(f"Failed {combination.combination_id}: {e}")
+                    for future in done:
+                        combination = pending.pop(future)
+                        submit_next()
+                        
+                        try:
+                            result = future.result()
+                            validation_results.append(result)
+                            self.completed_combinations += 1
+                            
+                            # Log progress
+                            progress_pct = (self.completed_combinations / self.total_combinations) * 100
+                            self.logger.info(
+                                f"Completed {combination.combination_id} "
+                                f"({self.completed_combinations}/{self.total_combinations}, {progress_pct:.1f}%)"
+                            )
+                            
+                        except Exception as e:
+                            self.failed_combinations += 1
+                            self.logger.error(f"Failed {combination.combination_id}: {e}")
+        finally:
+            log_listener.stop()
+        
+        if pool_broken:
+            undispatched = sum(1 for _ in remaining)
+            self.failed_combinations += undispatched
+            self.logger.error(
+                f"Worker process pool broke; {undispatched} combinations were not run. "
+                f"Returning the {len(validation_results)} results collected so far"
+            )
         
         self.logger.info(
             f"Parameter sweep completed. "
@@ -525,7 +781,6 @@ class OptimizationOrchestrator:
     
     def _generate_study_artifacts(
         self,
-        parameter_combinations: List[ParameterCombination],
         validation_results: List[Any],
         overfitting_assessments: List[Any]
     ) -> Dict[str, Any]:
@@ -542,23 +797,21 @@ class OptimizationOrchestrator:
         )
         
         summary_file = self.study_dir / 'optimization_summary.json'
-        with open(summary_file, 'w') as f:
-            json.dump(summary, f, indent=2, default=str)
+        _write_json(summary_file, summary)
         
         # Generate parameter sweep CSV
         self._generate_parameter_sweep_csv(validation_results, overfitting_assessments)
         
         # Generate study manifest
-        manifest = self._generate_study_manifest(parameter_combinations)
+        manifest = self._generate_study_manifest()
         
         manifest_file = self.study_dir / 'study_manifest.json'
-        with open(manifest_file, 'w') as f:
-            json.dump(manifest, f, indent=2, default=str)
+        _write_json(manifest_file, manifest)
         
         return {
             'study_id': self.study_id,
             'study_dir': str(self.study_dir),
-            'total_combinations': len(parameter_combinations),
+            'total_combinations': self.total_combinations,
             'successful_combinations': len(validation_results),
             'best_performance': summary.get('best_combination', {}).get('performance'),
             'summary_file': str(summary_file),
@@ -573,27 +826,29 @@ class OptimizationOrchestrator:
         """Generate optimization study summary"""
         
         primary_metric = self.config['primary_metric']
+        metric_key = f"{primary_metric}_mean"
+        minimize = self.config.get('minimize_metric', False)
+        
+        # Primary metric of every result, gathered once for both best
+        # selection and the summary statistics
+        all_performances = np.fromiter(
+            (r.aggregate_metrics[metric_key] for r in validation_results),
+            dtype=np.float64,
+            count=len(validation_results)
+        )
         
-        # Find best combination
+        # Find best combination (first of any ties, NaN scores never win)
         best_combination = None
-        best_performance = float('-inf') if not self.config.get('minimize_metric', False) else float('inf')
+        best_performance = float('inf') if minimize else float('-inf')
         
-        for result in validation_results:
-            performance = result.aggregate_metrics[f"{primary_metric}_mean"]
-            
-            if self.config.get('minimize_metric', False):
-                is_better = performance < best_performance
-            else:
-                is_better = performance > best_performance
-            
-            if is_better:
-                best_performance = performance
-                best_combination = result
+        if all_performances.size and not np.isnan(all_performances).all():
+            best_index = int(np.nanargmin(all_performances) if minimize else np.nanargmax(all_performances))
+            best_combination = validation_results[best_index]
+            best_performance = best_combination.aggregate_metrics[metric_key]
         
         # Calculate summary statistics
-        all_performances = [
-            r.aggregate_metrics[f"{primary_metric}_mean"] for r in validation_results
-        ]
+        has_performances = all_performances.size > 0
+        risk_counts = Counter(a.risk_level for a in overfitting_assessments)
         
         summary = {
             'study_overview': {
@@ -607,10 +862,10 @@ class OptimizationOrchestrator:
             },
             'performance_statistics': {
                 'best_performance': best_performance,
-                'worst_performance': min(all_performances) if all_performances else None,
-                'mean_performance': np.mean(all_performances) if all_performances else None,
-                'median_performance': np.median(all_performances) if all_performances else None,
-                'std_performance': np.std(all_performances) if all_performances else None
+                'worst_performance': all_performances.min() if has_performances else None,
+                'mean_performance': all_performances.mean() if has_performances else None,
+                'median_performance': np.median(all_performances) if has_performances else None,
+                'std_performance': all_performances.std() if has_performances else None
             },
             'best_combination': {
                 'combination_id': best_combination.combination_id if best_combination else None,
@@ -619,9 +874,9 @@ class OptimizationOrchestrator:
                 'stability_score': best_combination.stability_score if best_combination else None
             } if best_combination else None,
             'overfitting_summary': {
-                'low_risk_combinations': len([a for a in overfitting_assessments if a.risk_level == 'low']),
-                'medium_risk_combinations': len([a for a in overfitting_assessments if a.risk_level == 'medium']),
-                'high_risk_combinations': len([a for a in overfitting_assessments if a.risk_level == 'high'])
+                'low_risk_combinations': risk_counts['low'],
+                'medium_risk_combinations': risk_counts['medium'],
+                'high_risk_combinations': risk_counts['high']
             },
             'configuration': self.config
         }
@@ -635,8 +890,6 @@ class OptimizationOrchestrator:
     ) -> None:
         """Generate parameter sweep results CSV"""
         
-        import csv
-        
         csv_file = self.study_dir / 'parameter_sweep.csv'
         
         # Determine all parameter names and metrics
@@ -651,33 +904,28 @@ class OptimizationOrchestrator:
         overfitting_lookup = {
             a.combination_id: a for a in overfitting_assessments
         }
-        
-        with open(csv_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            
-            # Write header
-            header = ['combination_id'] + param_names + metric_names + [
-                'stability_score', 'overfitting_risk', 'overfitting_score'
-            ]
-            writer.writerow(header)
-            
-            # Write data rows
-            for result in validation_results:
-                overfitting = overfitting_lookup.get(result.combination_id)
-                
-                row = [result.combination_id]
-                row.extend([result.parameters[p] for p in param_names])
-                row.extend([result.aggregate_metrics[m] for m in metric_names])
-                row.append(result.stability_score)
-                row.append(overfitting.risk_level if overfitting else 'unknown')
-                row.append(overfitting.risk_score if overfitting else None)
-                
-                writer.writerow(row)
+        overfitting = [overfitting_lookup.get(r.combination_id) for r in validation_results]
+        
+        # Build the table column-wise. Every result must provide every
+        # parameter and metric of the first one (KeyError otherwise, as with
+        # row-wise writing). Columns are object dtype so each value is written
+        # as csv.writer would write it (no int-to-float upcasting): NaN floats
+        # become 'nan' up front, leaving na_rep='' for None.
+        columns = {'combination_id': [r.combination_id for r in validation_results]}
+        for p in param_names:
+            columns[p] = [_csv_cell(r.parameters[p]) for r in validation_results]
+        for m in metric_names:
+            columns[m] = [_csv_cell(r.aggregate_metrics[m]) for r in validation_results]
+        columns['stability_score'] = [_csv_cell(r.stability_score) for r in validation_results]
+        columns['overfitting_risk'] = [a.risk_level if a else 'unknown' for a in overfitting]
+        columns['overfitting_score'] = [_csv_cell(a.risk_score) if a else None for a in overfitting]
+        frame = pd.DataFrame(columns, dtype=object)
+        
+        # Rendered in memory and written with a single write. Bytes, so the
+        # CRLF rows are not newline-translated.
+        csv_file.write_bytes(frame.to_csv(index=False, lineterminator='\r\n', na_rep='').encode())
     
-    def _generate_study_manifest(
-        self,
-        parameter_combinations: List[ParameterCombination]
-    ) -> Dict[str, Any]:
+    def _generate_study_manifest(self) -> Dict[str, Any]:
         """Generate study manifest with metadata"""
         
         return {
@@ -686,11 +934,16 @@ class OptimizationOrchestrator:
                 'study_name': self.config['study_name'],
                 'creation_timestamp': datetime.now().isoformat(),
                 'config_path': str(self.config_path),
-                'config_hash': hashlib.md5(str(self.config).encode()).hexdigest()
+                # Canonical (key-sorted) JSON, so the hash does not depend on
+                # the order keys appear in the config file
+                'config_hash': hashlib.blake2b(
+                    json.dumps(self.config, sort_keys=True, default=str).encode(),
+                    digest_size=16
+                ).hexdigest()
             },
             'optimization_configuration': self.config,
             'parameter_space': {
-                'total_combinations_generated': len(parameter_combinations),
+                'total_combinations_generated': self.total_combinations,
                 'search_strategy': self.config['search_strategy'],
                 'optimization_parameters': [
                     param for param in self.config.keys() 
@@ -716,19 +969,27 @@ class OptimizationOrchestrator:
         registry_file = Path('docs/optimization/optimization_registry.csv')
         registry_file.parent.mkdir(parents=True, exist_ok=True)
         
-        # Create registry if it doesn't exist
-        if not registry_file.exists():
-            with open(registry_file, 'w', newline='') as f:
-                writer = csv.writer(f)
+        # The record (plus the header when the registry is new) is formatted
+        # in memory and appended with a single O_APPEND write, so records
+        # from concurrent studies are not interleaved
+        fd = os.open(
+            registry_file,
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0),
+            0o644
+        )
+        try:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            
+            # Create registry header if the file is new
+            if os.fstat(fd).st_size == 0:
                 writer.writerow([
                     'study_id', 'study_name', 'completion_timestamp', 
                     'total_combinations', 'successful_combinations',
                     'best_performance', 'primary_metric', 'status'
                 ])
-        
-        # Append study record
-        with open(registry_file, 'a', newline='') as f:
-            writer = csv.writer(f)
+            
+            # Append study record
             writer.writerow([
                 self.study_id,
                 self.config['study_name'],
@@ -739,21 +1000,84 @@ class OptimizationOrchestrator:
                 self.config['primary_metric'],
                 'completed'
             ])
+            
+            os.write(fd, buffer.getvalue().encode())
+        finally:
+            os.close(fd)
     
     def _update_study_status(self, status: str, error_msg: Optional[str] = None) -> None:
-        """Update study status in manifest"""
+        """
+        Update study status in manifest
         
-        status_file = self.study_dir / 'study_status.json'
+        Updates within flush_interval_ms of each other are coalesced, so only
+        the latest is written. Terminal statuses are written immediately, and
+        anything still pending is flushed at interpreter exit.
+        """
         
+        # The timestamp stays a datetime: orjson writes it in isoformat itself
         status_data = {
             'study_id': self.study_id,
             'status': status,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.now(),
             'error_message': error_msg
         }
         
-        with open(status_file, 'w') as f:
-            json.dump(status_data, f, indent=2)
+        with self._status_lock:
+            self._pending_status = status_data
+            _pending_status_orchestrators.add(self)
+            if self._status_timer is None and status not in _TERMINAL_STATUSES:
+                self._status_timer = threading.Timer(self._status_flush_interval, self._flush_status)
+                self._status_timer.daemon = True
+                self._status_timer.start()
+        
+        if status in _TERMINAL_STATUSES:
+            self._flush_status()
+    
+    def _flush_status(self) -> None:
+        """Write the pending study status, if any"""
+        with self._status_lock:
+            if self._status_timer is not None:
+                self._status_timer.cancel()
+                self._status_timer = None
+            
+            status_data = self._pending_status
+            if status_data is None:
+                return
+            self._pending_status = None
+            _pending_status_orchestrators.discard(self)
+            
+            self._write_study_status(status_data)
+    
+    def _write_study_status(self, status_data: Dict[str, Any]) -> None:
+        """
+        Write study_status.json
+        
+        The file is replaced atomically, so anything polling it sees either
+        the previous or the new status, never a truncated document.
+        """
+        status_file = self.study_dir / 'study_status.json'
+        tmp_file = status_file.with_suffix('.json.tmp')
+        
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(status_data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(status_data, indent=2, default=datetime.isoformat).encode()
+        
+        try:
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, status_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+
+
+def _flush_pending_statuses() -> None:
+    """Write every study status still waiting for its debounce timer"""
+    for orchestrator in list(_pending_status_orchestrators):
+        orchestrator._flush_status()
+
+
+atexit.register(_flush_pending_statuses)
 
 
 def main():
@@ -5,6 +5,7 @@ Implements statistical safeguards against curve-fitting in trading strategy opti
 """
 
 import json
+import bisect
 import numpy as np
 import pandas as pd
 from datetime import datetime
@@ -69,9 +70,11 @@ class OverfittingDetector:
         self.decay_threshold = config.get('out_of_sample_decay_threshold', 0.20)
         self.significance_p = config.get('statistical_significance_p', 0.05)
         
-        # Data snooping detection
+        # Data snooping detection (the history is also kept sorted, NaN
+        # excluded, for percentile ranking)
         self.combinations_tested = 0
         self.best_performance_history = []
+        self._sorted_performance_history = []
         
     def _setup_logging(self) -> logging.Logger:
         """Setup logging for overfitting detection"""
@@ -179,6 +182,8 @@ class OverfittingDetector:
         # Update global tracking
         self.combinations_tested += 1
         self.best_performance_history.append(metrics.out_sample_performance)
+        if metrics.out_sample_performance == metrics.out_sample_performance:
+            bisect.insort(self._sorted_performance_history, metrics.out_sample_performance)
         
         return OverfittingAssessment(
             combination_id=combination_id,
@@ -444,8 +449,13 @@ class OverfittingDetector:
         if len(self.best_performance_history) == 0:
             return 0.5  # Neutral score for first combination
         
-        # Calculate percentile rank
-        better_count = sum(1 for p in self.best_performance_history if performance > p)
+        # Calculate percentile rank: the number of earlier performances
+        # strictly below this one, found by bisection rather than a scan of
+        # the whole history (nothing compares greater than NaN)
+        if performance == performance:
+            better_count = bisect.bisect_left(self._sorted_performance_history, performance)
+        else:
+            better_count = 0
         percentile = better_count / len(self.best_performance_history)
         
         return percentile